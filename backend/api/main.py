@@ -70,6 +70,7 @@ class FiltersUpdate(BaseModel):
     required_keywords: Optional[List[str]] = None
     excluded_keywords: Optional[List[str]] = None
     blacklisted_companies: Optional[List[str]] = None
+    blacklist_mode: Optional[str] = None
 
 
 class ScrapeRequest(BaseModel):
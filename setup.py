@@ -41,6 +41,7 @@ setup(
             "lxml>=4.9.0",
             "pdfplumber>=0.7.0",
             "python-docx>=0.8.11",
+            "orjson>=3.9.0",
         ],
         "dev": [
             "pytest>=7.0.0",
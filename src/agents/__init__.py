@@ -1,15 +1,25 @@
 """JobCopilot Agents"""
 
-from .profile_agent import ProfileAgent
-from .resume_parser_agent import ResumeParserAgent
-from .scraper_agent import ScraperAgent
-from .matcher_agent import MatcherAgent
-from .resume_tailor_agent import ResumeTailorAgent
-from .cover_letter_agent import CoverLetterAgent
-from .form_filler_agent import FormFillerAgent
-from .qa_agent import QAAgent
-from .tracker_agent import TrackerAgent
-from .digest_agent import DigestAgent
+import importlib
+from typing import Any, List
+
+# Registry name -> (agent class, defining submodule). Classes are imported on
+# first access (PEP 562), so using one agent does not load all the others;
+# AgentRegistry loads agents by name from the same table
+AGENT_MODULES = {
+    "PROFILE_AGENT": ("ProfileAgent", ".profile_agent"),
+    "RESUME_PARSER_AGENT": ("ResumeParserAgent", ".resume_parser_agent"),
+    "SCRAPER_AGENT": ("ScraperAgent", ".scraper_agent"),
+    "MATCHER_AGENT": ("MatcherAgent", ".matcher_agent"),
+    "RESUME_TAILOR_AGENT": ("ResumeTailorAgent", ".resume_tailor_agent"),
+    "COVER_LETTER_AGENT": ("CoverLetterAgent", ".cover_letter_agent"),
+    "FORM_FILLER_AGENT": ("FormFillerAgent", ".form_filler_agent"),
+    "QA_AGENT": ("QAAgent", ".qa_agent"),
+    "TRACKER_AGENT": ("TrackerAgent", ".tracker_agent"),
+    "DIGEST_AGENT": ("DigestAgent", ".digest_agent"),
+}
+
+_LAZY = {class_name: module for class_name, module in AGENT_MODULES.values()}
 
 __all__ = [
     "ProfileAgent",
@@ -23,3 +33,15 @@ __all__ = [
     "TrackerAgent",
     "DigestAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    agent_class = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = agent_class
+    return agent_class
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,25 +1,30 @@
 """Cover Letter Agent - Generates customized cover letters"""
 
-import re
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
 from ..schemas import AgentOutput
+from ..utils.keywords import keyword_matcher
+
+
+# Technical terms highlighted in cover letters
+_TECH_TERMS = (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "Go", "Rust",
+    "React", "Angular", "Vue", "Django", "Flask", "Node.js",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes",
+    "SQL", "PostgreSQL", "MongoDB", "Redis",
+    "Machine Learning", "AI", "Data Science"
+)
 
 
 @AgentRegistry.register
 class CoverLetterAgent(BaseAgent):
     """Agent responsible for generating tailored cover letters"""
 
-    @property
-    def name(self) -> str:
-        return "COVER_LETTER_AGENT"
-
-    @property
-    def description(self) -> str:
-        return "Generates customized cover letters for job applications"
+    NAME = "COVER_LETTER_AGENT"
+    DESCRIPTION = "Generates customized cover letters for job applications"
 
     # Cover letter templates
     TEMPLATES = {
@@ -267,18 +272,7 @@ Sincerely,
             " ".join(job.get("requirements", []))
         )
 
-        keywords = set()
-        patterns = [
-            r'\b(?:Python|JavaScript|TypeScript|Java|C\+\+|Go|Rust)\b',
-            r'\b(?:React|Angular|Vue|Django|Flask|Node\.js)\b',
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes)\b',
-            r'\b(?:SQL|PostgreSQL|MongoDB|Redis)\b',
-            r'\b(?:Machine Learning|AI|Data Science)\b'
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            keywords.update(matches)
+        keywords = set(keyword_matcher(_TECH_TERMS).findall(text))
 
         return list(keywords)
 
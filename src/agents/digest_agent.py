@@ -13,13 +13,8 @@ from ..schemas import AgentOutput, ApplicationStatus
 class DigestAgent(BaseAgent):
     """Agent responsible for creating daily summaries and reports"""
 
-    @property
-    def name(self) -> str:
-        return "DIGEST_AGENT"
-
-    @property
-    def description(self) -> str:
-        return "Creates daily summaries and progress reports"
+    NAME = "DIGEST_AGENT"
+    DESCRIPTION = "Creates daily summaries and progress reports"
 
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute digest tasks"""
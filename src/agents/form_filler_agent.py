@@ -13,13 +13,8 @@ from ..schemas import AgentOutput
 class FormFillerAgent(BaseAgent):
     """Agent responsible for filling out job application forms"""
 
-    @property
-    def name(self) -> str:
-        return "FORM_FILLER_AGENT"
-
-    @property
-    def description(self) -> str:
-        return "Maps user data to job application form fields"
+    NAME = "FORM_FILLER_AGENT"
+    DESCRIPTION = "Maps user data to job application form fields"
 
     # Standard field mappings
     FIELD_MAPPINGS = {
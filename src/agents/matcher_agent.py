@@ -1,25 +1,27 @@
 """Matcher Agent - Scores job-user fit"""
 
+import heapq
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 
 from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
-from ..schemas import AgentOutput, JobStatus
+from ..schemas import AgentOutput, JobStatus, BLACKLIST_MODES, DEFAULT_BLACKLIST_MODE
 
 
 @AgentRegistry.register
 class MatcherAgent(BaseAgent):
     """Agent responsible for matching users to jobs and scoring fit"""
 
-    @property
-    def name(self) -> str:
-        return "MATCHER_AGENT"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # user_id -> (applications version, applied job ids), least recent first
+        self._applied_cache: "OrderedDict[str, Tuple[Tuple, FrozenSet[str]]]" = OrderedDict()
 
-    @property
-    def description(self) -> str:
-        return "Scores job-user fit and ranks opportunities"
+    NAME = "MATCHER_AGENT"
+    DESCRIPTION = "Scores job-user fit and ranks opportunities"
 
     # Weight configuration for matching
     WEIGHTS = {
@@ -31,6 +33,13 @@ class MatcherAgent(BaseAgent):
         "experience_level": 5
     }
 
+    # Users whose applied job ids are kept between calls
+    APPLIED_CACHE_SIZE = 256
+
+    # Blacklist matching modes, defined with the Filters schema
+    BLACKLIST_MODES = BLACKLIST_MODES
+    DEFAULT_BLACKLIST_MODE = DEFAULT_BLACKLIST_MODE
+
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute matching tasks"""
         action = task.get("action", "")
@@ -79,7 +88,8 @@ class MatcherAgent(BaseAgent):
         score, breakdown = self._calculate_match_score(user, job)
 
         # Check filters
-        filtered_out, filter_reason = self._check_filters(user, job)
+        ctx = self._build_user_ctx(user)
+        filtered_out, filter_reason = self._check_filters(ctx, job)
 
         result = {
             "job_id": job_id,
@@ -129,18 +139,21 @@ class MatcherAgent(BaseAgent):
         if not job_ids:
             jobs = self.database.get_jobs_by_status(JobStatus.NEW.value)
             job_ids = [j["job_id"] for j in jobs]
-
+        else:
+            jobs = []
+            for job_id in job_ids:
+                job = self.database.get_job(job_id)
+                if job:
+                    job.setdefault("job_id", job_id)
+                    jobs.append(job)
+
+        ctx = self._build_user_ctx(user)
         matches = []
         qualified_jobs = []
 
-        for job_id in job_ids:
-            job = self.database.get_job(job_id)
-            if not job:
-                continue
-
-            score, breakdown = self._calculate_match_score(user, job)
-            filtered_out, filter_reason = self._check_filters(user, job)
-
+        for job in jobs:
+            score, _, filtered_out, filter_reason = self._score_job(user, ctx, job)
+            job_id = job["job_id"]
             match_result = {
                 "job_id": job_id,
                 "title": job.get("title", ""),
@@ -196,11 +209,10 @@ class MatcherAgent(BaseAgent):
         # Get matched jobs
         jobs = self.database.get_jobs_by_status(JobStatus.MATCHED.value)
 
+        ctx = self._build_user_ctx(user)
         ranked = []
         for job in jobs:
-            score, _ = self._calculate_match_score(user, job)
-            filtered_out, _ = self._check_filters(user, job)
-
+            score, _, filtered_out, _ = self._score_job(user, ctx, job)
             if not filtered_out:
                 ranked.append({
                     "job_id": job["job_id"],
@@ -242,31 +254,40 @@ class MatcherAgent(BaseAgent):
                 output_data={"error": f"User not found: {user_id}"}
             )
 
-        # Get all jobs that haven't been applied to
-        all_jobs = self.database.search_jobs(limit=500)
-        user_apps = self.database.get_user_applications(user_id)
-        applied_job_ids = {app["job_id"] for app in user_apps}
+        # Stream jobs that haven't been applied to, keeping only the top `limit`
+        applied_job_ids = self._get_applied_job_ids(user_id)
 
-        recommendations = []
-        for job in all_jobs:
+        ctx = self._build_user_ctx(user)
+        heap: List[Tuple[float, int, Dict, Dict]] = []
+        index = 0
+        for job in self.database.iter_jobs(limit=500):
             if job["job_id"] in applied_job_ids:
                 continue
+            index += 1
+            score, breakdown, filtered_out, _ = self._score_job(user, ctx, job)
+            if score < min_score or filtered_out:
+                continue
+            if len(heap) >= limit and (not heap or score <= heap[0][0]):
+                continue
 
-            score, breakdown = self._calculate_match_score(user, job)
-            filtered_out, _ = self._check_filters(user, job)
-
-            if score >= min_score and not filtered_out:
-                recommendations.append({
-                    "job_id": job["job_id"],
-                    "title": job.get("title", ""),
-                    "company": job.get("company", ""),
-                    "location": job.get("location", ""),
-                    "match_score": score,
-                    "highlights": self._get_match_highlights(user, job, breakdown)
-                })
+            # Negated index breaks score ties in favour of newer jobs
+            entry = (score, -index, job, breakdown)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
 
-        recommendations.sort(key=lambda x: x["match_score"], reverse=True)
-        recommendations = recommendations[:limit]
+        recommendations = [
+            {
+                "job_id": job["job_id"],
+                "title": job.get("title", ""),
+                "company": job.get("company", ""),
+                "location": job.get("location", ""),
+                "match_score": score,
+                "highlights": self._get_match_highlights(user, job, breakdown)
+            }
+            for score, _, job, breakdown in sorted(heap, reverse=True)
+        ]
 
         return self.create_output(
             action="recommendations_generated",
@@ -277,6 +298,34 @@ class MatcherAgent(BaseAgent):
             }
         )
 
+    def _get_applied_job_ids(self, user_id: str) -> FrozenSet[str]:
+        """Get applied job ids, reusing the cached set while the applications are unchanged"""
+        version = self.database.get_user_applications_version(user_id)
+        cache = self._applied_cache
+        cached = cache.get(user_id)
+        if cached and cached[0] == version:
+            cache.move_to_end(user_id)
+            return cached[1]
+
+        user_apps = self.database.get_user_applications(user_id, with_timeline=False)
+        applied_job_ids = frozenset(app["job_id"] for app in user_apps)
+        cache[user_id] = (version, applied_job_ids)
+        cache.move_to_end(user_id)
+        while len(cache) > self.APPLIED_CACHE_SIZE:
+            cache.popitem(last=False)
+        return applied_job_ids
+
+    def _score_job(
+        self,
+        user: Dict,
+        ctx: Dict[str, Any],
+        job: Dict
+    ) -> Tuple[float, Dict, bool, Optional[str]]:
+        """Score a job and check it against the user's filters"""
+        score, breakdown = self._calculate_match_score(user, job)
+        filtered_out, filter_reason = self._check_filters(ctx, job)
+        return score, breakdown, filtered_out, filter_reason
+
     def _calculate_match_score(self, user: Dict, job: Dict) -> Tuple[float, Dict]:
         """Calculate match score between user and job"""
         breakdown = {}
@@ -347,17 +396,17 @@ class MatcherAgent(BaseAgent):
 
         user_skills.update(s.lower() for s in resume.get("extracted_keywords", []))
 
+        n_skills = len(user_skills)
+        if n_skills == 0:
+            return 50
+
         # Extract skills from job requirements
         job_requirements = " ".join(job.get("requirements", []) + [job.get("description", "")])
         job_requirements_lower = job_requirements.lower()
 
         matched_skills = sum(1 for skill in user_skills if skill in job_requirements_lower)
 
-        if len(user_skills) == 0:
-            return 50
-
-        match_ratio = matched_skills / max(len(user_skills), 1)
-        return min(100, match_ratio * 100 + 20)
+        return min(100.0, matched_skills * (100.0 / n_skills) + 20.0)
 
     def _calculate_location_match(self, user: Dict, job: Dict) -> float:
         """Calculate location match score"""
@@ -443,20 +492,53 @@ class MatcherAgent(BaseAgent):
         matched = sum(1 for req in required if req in job_text)
         return (matched / len(required)) * 100
 
-    def _check_filters(self, user: Dict, job: Dict) -> Tuple[bool, Optional[str]]:
-        """Check if job passes user filters"""
+    def _build_user_ctx(self, user: Dict) -> Dict[str, Any]:
+        """Precompute the per-user filter data shared by every job in a batch"""
         filters = user.get("filters", {})
+        blacklist = tuple(c.lower() for c in filters.get("blacklisted_companies", []))
 
+        blacklist_mode = filters.get("blacklist_mode") or self.DEFAULT_BLACKLIST_MODE
+        if blacklist_mode not in self.BLACKLIST_MODES:
+            self.logger.warning(
+                f"Unknown blacklist_mode '{blacklist_mode}', "
+                f"using '{self.DEFAULT_BLACKLIST_MODE}'"
+            )
+            blacklist_mode = self.DEFAULT_BLACKLIST_MODE
+
+        return {
+            "blacklist": blacklist,
+            "blacklist_set": frozenset(blacklist),
+            "blacklist_mode": blacklist_mode,
+            "excluded": [k.lower() for k in filters.get("excluded_keywords", [])],
+            "required": [k.lower() for k in filters.get("required_keywords", [])],
+        }
+
+    def _is_blacklisted(self, ctx: Dict[str, Any], company_lower: str) -> bool:
+        """Check a lowercased company name against the user's blacklist"""
+        blacklist = ctx["blacklist"]
+        if not blacklist:
+            return False
+
+        mode = ctx["blacklist_mode"]
+        if mode == "exact":
+            return company_lower in ctx["blacklist_set"]
+        if mode == "prefix":
+            return company_lower.startswith(blacklist)
+        return any(blocked in company_lower for blocked in blacklist)
+
+    def _check_filters(self, ctx: Dict[str, Any], job: Dict) -> Tuple[bool, Optional[str]]:
+        """Check if job passes user filters"""
         # Check blacklisted companies
-        blacklist = [c.lower() for c in filters.get("blacklisted_companies", [])]
         company = job.get("company", "").lower()
-
-        for blocked in blacklist:
-            if blocked in company:
-                return True, f"Company '{job.get('company')}' is blacklisted"
+        if self._is_blacklisted(ctx, company):
+            return True, f"Company '{job.get('company')}' is blacklisted"
 
         # Check excluded keywords
-        excluded = [k.lower() for k in filters.get("excluded_keywords", [])]
+        excluded = ctx["excluded"]
+        required = ctx["required"]
+        if not excluded and not required:
+            return False, None
+
         job_text = (
             job.get("title", "") + " " +
             job.get("description", "")
@@ -467,7 +549,6 @@ class MatcherAgent(BaseAgent):
                 return True, f"Contains excluded keyword: '{excl}'"
 
         # Check required keywords
-        required = [k.lower() for k in filters.get("required_keywords", [])]
         for req in required:
             if req not in job_text:
                 return True, f"Missing required keyword: '{req}'"
@@ -8,7 +8,7 @@ from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
 from ..schemas import (
     AgentOutput, UserProfile, Personal, JobPreferences,
-    Filters, Resume, RemotePreference
+    Filters, Resume, RemotePreference, DEFAULT_BLACKLIST_MODE
 )
 
 
@@ -16,13 +16,8 @@ from ..schemas import (
 class ProfileAgent(BaseAgent):
     """Agent responsible for managing user profiles and preferences"""
 
-    @property
-    def name(self) -> str:
-        return "PROFILE_AGENT"
-
-    @property
-    def description(self) -> str:
-        return "Manages user data, preferences, and profile information"
+    NAME = "PROFILE_AGENT"
+    DESCRIPTION = "Manages user data, preferences, and profile information"
 
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute profile management tasks"""
@@ -40,6 +35,8 @@ class ProfileAgent(BaseAgent):
             return self._update_filters(task)
         elif action == "set_resume":
             return self._set_resume(task)
+        elif action == "update_all":
+            return self._update_all(task)
         else:
             return self.create_output(
                 action="error",
@@ -91,7 +88,8 @@ class ProfileAgent(BaseAgent):
             profile.filters = Filters(
                 required_keywords=filters_data.get("required_keywords", []),
                 excluded_keywords=filters_data.get("excluded_keywords", []),
-                blacklisted_companies=filters_data.get("blacklisted_companies", [])
+                blacklisted_companies=filters_data.get("blacklisted_companies", []),
+                blacklist_mode=filters_data.get("blacklist_mode", DEFAULT_BLACKLIST_MODE)
             )
 
         # Save to database
@@ -126,34 +124,83 @@ class ProfileAgent(BaseAgent):
                 output_data={"error": "user_id is required"}
             )
 
-        profile = self.database.get_user(user_id)
+        patch = self._section_patch(task)
+        profile = self._patch_profile(user_id, patch)
         if not profile:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Profile not found: {user_id}"}
             )
 
-        # Update personal info if provided
-        if "personal" in task:
-            profile["personal"].update(task["personal"])
+        return self.create_output(
+            action="profile_updated",
+            output_data=profile,
+            save_to_memory={f"users.{user_id}": profile}
+        )
 
-        # Update job preferences if provided
-        if "job_preferences" in task:
-            profile["job_preferences"].update(task["job_preferences"])
+    def _update_all(self, task: Dict[str, Any]) -> AgentOutput:
+        """Update personal info, preferences, filters and resume in one write"""
+        user_id = task.get("user_id")
+        if not user_id:
+            return self.create_output(
+                action="error",
+                output_data={"error": "user_id is required"}
+            )
 
-        # Update filters if provided
-        if "filters" in task:
-            profile["filters"].update(task["filters"])
+        patch = self._section_patch(task)
+        has_resume = "resume_text" in task or "resume_path" in task
+        if has_resume:
+            patch["resume"] = {
+                "raw_text": task.get("resume_text", ""),
+                "file_path": task.get("resume_path", "")
+            }
 
-        # Save updated profile
-        self.database.save_user(user_id, profile)
+        profile = self._patch_profile(user_id, patch)
+        if not profile:
+            return self.create_output(
+                action="error",
+                output_data={"error": f"Profile not found: {user_id}"}
+            )
 
         return self.create_output(
             action="profile_updated",
             output_data=profile,
+            next_agent="RESUME_PARSER_AGENT" if has_resume else None,
+            pass_data={
+                "user_id": user_id,
+                "resume_text": patch["resume"]["raw_text"],
+                "resume_path": patch["resume"]["file_path"]
+            } if has_resume else None,
             save_to_memory={f"users.{user_id}": profile}
         )
 
+    def _section_patch(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect the profile sections a task updates"""
+        return {
+            section: task[section]
+            for section in ("personal", "job_preferences", "filters")
+            if section in task
+        }
+
+    def _apply_patch(self, profile: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge partial section updates into a profile in place"""
+        for section in ("personal", "job_preferences", "filters", "resume"):
+            if section in patch:
+                if not isinstance(profile.get(section), dict):
+                    profile[section] = {}
+                profile[section].update(patch[section])
+        return profile
+
+    def _patch_profile(self, user_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Load a profile, apply a patch and save it with a single write"""
+        profile = self.database.get_user(user_id)
+        if not profile:
+            return None
+
+        self._apply_patch(profile, patch)
+        self.database.save_user(user_id, profile)
+        return profile
+
     def _get_profile(self, task: Dict[str, Any]) -> AgentOutput:
         """Get a user profile"""
         user_id = task.get("user_id")
@@ -186,16 +233,13 @@ class ProfileAgent(BaseAgent):
                 output_data={"error": "user_id is required"}
             )
 
-        profile = self.database.get_user(user_id)
+        profile = self._patch_profile(user_id, {"job_preferences": preferences})
         if not profile:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Profile not found: {user_id}"}
             )
 
-        profile["job_preferences"].update(preferences)
-        self.database.save_user(user_id, profile)
-
         return self.create_output(
             action="preferences_updated",
             output_data={"user_id": user_id, "job_preferences": profile["job_preferences"]}
@@ -212,16 +256,13 @@ class ProfileAgent(BaseAgent):
                 output_data={"error": "user_id is required"}
             )
 
-        profile = self.database.get_user(user_id)
+        profile = self._patch_profile(user_id, {"filters": filters})
         if not profile:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Profile not found: {user_id}"}
             )
 
-        profile["filters"].update(filters)
-        self.database.save_user(user_id, profile)
-
         return self.create_output(
             action="filters_updated",
             output_data={"user_id": user_id, "filters": profile["filters"]}
@@ -239,17 +280,15 @@ class ProfileAgent(BaseAgent):
                 output_data={"error": "user_id is required"}
             )
 
-        profile = self.database.get_user(user_id)
+        profile = self._patch_profile(user_id, {
+            "resume": {"raw_text": resume_text, "file_path": resume_path}
+        })
         if not profile:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Profile not found: {user_id}"}
             )
 
-        profile["resume"]["raw_text"] = resume_text
-        profile["resume"]["file_path"] = resume_path
-        self.database.save_user(user_id, profile)
-
         # Trigger resume parsing
         return self.create_output(
             action="resume_set",
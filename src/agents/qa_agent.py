@@ -1,96 +1,407 @@
 """QA Agent - Answers application questions"""
 
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
+from enum import IntEnum
 
 from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
 from ..schemas import AgentOutput
 
 
+# Joins questions for batch classification; the batch classifier never matches across it
+QUESTION_SEPARATOR = "\x1e"
+
+
+class QType(IntEnum):
+    """Known question types, in QUESTION_PATTERNS priority order"""
+    WORK_AUTHORIZATION = 1
+    RELOCATION = 2
+    START_DATE = 3
+    SALARY_EXPECTATION = 4
+    WHY_INTERESTED = 5
+    WHY_LEAVING = 6
+    STRENGTHS = 7
+    WEAKNESSES = 8
+    EXPERIENCE_YEARS = 9
+    REMOTE_PREFERENCE = 10
+    REFERRAL = 11
+    TRAVEL = 12
+
+    @property
+    def label(self) -> str:
+        """Question type name as used in QUESTION_PATTERNS and agent output"""
+        return self.name.lower()
+
+
+_QTYPE_BY_LABEL = {qtype.label: qtype for qtype in QType}
+
+
+class UserContext(NamedTuple):
+    """Profile fields read by the answer generators, extracted once per request"""
+    remote_pref: str
+    salary_min: Optional[int]
+    salary_max: Optional[int]
+    technical_skills: List[str]
+    experience_years: int
+
+    @classmethod
+    def from_user(cls, user: Optional[Dict]) -> "UserContext":
+        user = user or {}
+        prefs = user.get("job_preferences", {})
+        resume = user.get("resume", {}).get("parsed", {})
+        skills = resume.get("skills", {})
+        experience = resume.get("experience", [])
+        return cls(
+            remote_pref=prefs.get("remote_preference", "any"),
+            salary_min=prefs.get("salary_min"),
+            salary_max=prefs.get("salary_max"),
+            technical_skills=skills.get("technical", []) if isinstance(skills, dict) else [],
+            experience_years=len(experience) * 2 if experience else 0
+        )
+
+
+def _build_classifier(
+    patterns: Dict[str, List[str]],
+    separator: Optional[str] = None
+) -> "re.Pattern[str]":
+    """Compile per-type question patterns into a single classifier regex"""
+    # Each type becomes a lookahead branch tried in declaration order at the
+    # start of the question, so the first type with any matching pattern wins,
+    # exactly as when the types were searched one at a time.
+    if separator is None:
+        branches = (
+            rf"(?=[\s\S]*?(?:{'|'.join(type_patterns)}))(?P<{q_type}>)"
+            for q_type, type_patterns in patterns.items()
+        )
+        return re.compile("|".join(branches), re.IGNORECASE)
+
+    # Batch variant: matches at each separator of separator-joined questions
+    # and never looks past the next one, so every question is classified on
+    # its own. Only valid for questions that do not contain the separator.
+    within_line = f"[^{separator}\\n]*"
+    branches = []
+    for q_type, type_patterns in patterns.items():
+        alternatives = "|".join(p.replace(".*", within_line) for p in type_patterns)
+        branches.append(f"(?=[^{separator}]*?(?:{alternatives}))(?P<{q_type}>)")
+
+    return re.compile(f"{separator}(?:{'|'.join(branches)})", re.IGNORECASE)
+
+
+def _build_keyword_masks(
+    patterns: Dict[str, List[str]]
+) -> Tuple[Tuple[Tuple[str, int], ...], Tuple[int, ...]]:
+    """Assign a bit to each literal keyword and a required bitmask to each pattern"""
+    pattern_keywords = [
+        [token for token in pattern.split(".*") if re.fullmatch(r"[\w ]+", token)]
+        for type_patterns in patterns.values()
+        for pattern in type_patterns
+    ]
+    keywords = sorted({kw for kws in pattern_keywords for kw in kws})
+    bits = {kw: 1 << i for i, kw in enumerate(keywords)}
+    required_masks = tuple(sum(bits[kw] for kw in kws) for kws in pattern_keywords)
+    return tuple(bits.items()), required_masks
+
+
+def _build_fast_path(
+    phrases: Tuple[Tuple[str, QType], ...],
+    patterns: Dict[str, List[str]]
+) -> Tuple[Tuple[str, QType, Tuple[str, ...]], ...]:
+    """Pair each fast-path phrase with keywords that could let a higher-priority type match"""
+    # A phrase always satisfies some pattern of its own type, but the classifier
+    # gives earlier types priority. Every earlier pattern needs all of its
+    # literal keywords, so if the longest one of each is absent none of them
+    # can match and the phrase's type is exactly what the classifier returns.
+    # A pattern without literal keywords blocks with "", which is always found.
+    types = list(patterns)
+    fast_path = []
+    for phrase, q_type in phrases:
+        blockers = {
+            max(
+                (t for t in pattern.split(".*") if re.fullmatch(r"[\w ]+", t)),
+                key=len,
+                default=""
+            )
+            for earlier in types[:types.index(q_type.label)]
+            for pattern in patterns[earlier]
+        }
+        fast_path.append((phrase, q_type, tuple(sorted(blockers))))
+    return tuple(fast_path)
+
+
+# Common question patterns, keyed by question type in priority order
+QUESTION_PATTERNS: Dict[str, List[str]] = {
+    "work_authorization": [
+        r"authorized.*work",
+        r"legal.*work",
+        r"visa.*status",
+        r"work.*permit",
+        r"employment.*eligibility"
+    ],
+    "relocation": [
+        r"willing.*relocate",
+        r"open.*relocation",
+        r"relocate.*position"
+    ],
+    "start_date": [
+        r"when.*start",
+        r"availability",
+        r"start.*date",
+        r"earliest.*start"
+    ],
+    "salary_expectation": [
+        r"salary.*expectation",
+        r"expected.*salary",
+        r"compensation.*expect",
+        r"desired.*salary"
+    ],
+    "why_interested": [
+        r"why.*interested",
+        r"why.*apply",
+        r"why.*want.*work",
+        r"what.*interest"
+    ],
+    "why_leaving": [
+        r"why.*leaving",
+        r"reason.*leave",
+        r"leaving.*current"
+    ],
+    "strengths": [
+        r"greatest.*strength",
+        r"your.*strength",
+        r"best.*qualities"
+    ],
+    "weaknesses": [
+        r"greatest.*weakness",
+        r"your.*weakness",
+        r"areas.*improve"
+    ],
+    "experience_years": [
+        r"years.*experience",
+        r"how.*long.*experience",
+        r"experience.*years"
+    ],
+    "remote_preference": [
+        r"remote.*work",
+        r"work.*remote",
+        r"hybrid.*office",
+        r"on-?site.*remote"
+    ],
+    "referral": [
+        r"how.*hear",
+        r"referred.*by",
+        r"learn.*about.*position"
+    ],
+    "travel": [
+        r"willing.*travel",
+        r"travel.*requirement",
+        r"open.*travel"
+    ]
+}
+
+# Questions longer than this are screened by keyword before classification
+KEYWORD_PREFILTER_MIN_LENGTH = 120
+
+_COMPILED = _build_classifier(QUESTION_PATTERNS)
+# Matches at each separator of a separator-led batch of questions
+_BATCH_COMPILED = _build_classifier(QUESTION_PATTERNS, separator=QUESTION_SEPARATOR)
+_KEYWORD_BITS, _REQUIRED_MASKS = _build_keyword_masks(QUESTION_PATTERNS)
+# No pattern can match fewer characters than the literal keywords it requires
+_MIN_MATCH_LENGTH = min(
+    sum(len(kw) for kw, bit in _KEYWORD_BITS if bit & mask) for mask in _REQUIRED_MASKS
+)
+
+
+# Literal phrases of the most frequent questions, checked before the classifier
+FAST_PATH_PHRASES: Tuple[Tuple[str, QType], ...] = (
+    ("authorized to work", QType.WORK_AUTHORIZATION),
+    ("work permit", QType.WORK_AUTHORIZATION),
+    ("visa status", QType.WORK_AUTHORIZATION),
+    ("willing to relocate", QType.RELOCATION),
+    ("when can you start", QType.START_DATE),
+    ("start date", QType.START_DATE),
+    ("expected salary", QType.SALARY_EXPECTATION),
+    ("salary expectation", QType.SALARY_EXPECTATION),
+    ("why are you interested", QType.WHY_INTERESTED),
+    ("why are you leaving", QType.WHY_LEAVING),
+    ("greatest strength", QType.STRENGTHS),
+    ("greatest weakness", QType.WEAKNESSES),
+    ("years of experience", QType.EXPERIENCE_YEARS),
+    ("how did you hear", QType.REFERRAL),
+    ("willing to travel", QType.TRAVEL),
+)
+
+_FAST_PATH = _build_fast_path(FAST_PATH_PHRASES, QUESTION_PATTERNS)
+
+
+def precompile_patterns() -> None:
+    """Warm-up hook; the classifier regexes are compiled when this module is imported"""
+
+
+def _may_match(question: str) -> bool:
+    """Cheaply rule out questions that no pattern can match"""
+    # Every classifier branch rescans the whole question, which gets costly
+    # for long free-text prompts that mostly match nothing. One pass over the
+    # literal keywords rules them out unless some pattern could still match.
+    length = len(question)
+    if length < _MIN_MATCH_LENGTH:
+        return False
+    if length <= KEYWORD_PREFILTER_MIN_LENGTH:
+        return True
+
+    question_lower = question.lower()
+    found = 0
+    for keyword, bit in _KEYWORD_BITS:
+        if keyword in question_lower:
+            found |= bit
+    return any(mask & found == mask for mask in _REQUIRED_MASKS)
+
+
+def _fast_classify(question: str) -> Optional[QType]:
+    """Classify common questions by literal phrase, without the regex"""
+    question_lower = question.lower()
+    for needle, q_type, blockers in _FAST_PATH:
+        if needle in question_lower:
+            if any(blocker in question_lower for blocker in blockers):
+                return None
+            return q_type
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify(question: str) -> Optional[QType]:
+    """Classify a question, memoized since forms repeat the same questions verbatim"""
+    q_type = _fast_classify(question)
+    if q_type is not None:
+        return q_type
+
+    if not _may_match(question):
+        return None
+
+    match = _COMPILED.match(question)
+    return _QTYPE_BY_LABEL[match.lastgroup] if match else None
+
+
+def _build_confidence_table() -> Dict[Tuple[Optional[QType], bool, bool], str]:
+    """Confidence for each (question type, has salary_min, has experience) combination"""
+    table = {}
+    for q_type in (None, *QType):
+        for has_salary in (False, True):
+            for has_experience in (False, True):
+                if q_type is None:
+                    confidence = "low"
+                elif q_type is QType.SALARY_EXPECTATION:
+                    confidence = "high" if has_salary else "medium"
+                elif q_type is QType.EXPERIENCE_YEARS:
+                    confidence = "high" if has_experience else "medium"
+                elif q_type in (QType.WORK_AUTHORIZATION, QType.START_DATE, QType.REFERRAL):
+                    confidence = "medium"
+                else:
+                    confidence = "high"
+                table[(q_type, has_salary, has_experience)] = confidence
+    return table
+
+
+_CONFIDENCE = _build_confidence_table()
+
+
+@lru_cache(maxsize=512)
+def _format_salary(min_sal: Optional[int], max_sal: Optional[int]) -> str:
+    """Salary expectation answer for a target band, cached since bands repeat"""
+    if min_sal and max_sal:
+        return (
+            f"Based on my experience and market research, I am looking for compensation "
+            f"in the range of ${min_sal:,} to ${max_sal:,}. However, I am open to "
+            f"discussing this based on the total compensation package."
+        )
+    elif min_sal:
+        return (
+            f"I am looking for compensation of ${min_sal:,} or above, depending on "
+            f"the full benefits and growth opportunities."
+        )
+    return (
+        "I am open to discussing compensation based on the role responsibilities "
+        "and the total package offered."
+    )
+
+
+@lru_cache(maxsize=512)
+def _why_interested(company: str, title: str) -> str:
+    """Why-are-you-interested answer for a company and role"""
+    return (
+        f"I am excited about the {title} opportunity at {company} because it aligns "
+        f"perfectly with my skills and career goals. The company's mission and the "
+        f"innovative work being done here particularly appeal to me."
+    )
+
+
 @AgentRegistry.register
 class QAAgent(BaseAgent):
     """Agent responsible for answering application questions"""
 
-    @property
-    def name(self) -> str:
-        return "QA_AGENT"
+    __slots__ = ("_dynamic_answers",)
 
-    @property
-    def description(self) -> str:
-        return "Answers common application questions using user profile data"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Answer generators for question types that depend on user or job data
+        self._dynamic_answers = {
+            QType.RELOCATION: self._ans_relocation,
+            QType.SALARY_EXPECTATION: self._ans_salary,
+            QType.WHY_INTERESTED: self._ans_why_interested,
+            QType.STRENGTHS: self._ans_strengths,
+            QType.EXPERIENCE_YEARS: self._ans_experience_years,
+            QType.REMOTE_PREFERENCE: self._ans_remote_preference,
+        }
+
+    NAME = "QA_AGENT"
+    DESCRIPTION = "Answers common application questions using user profile data"
 
     # Common question patterns and answer generators
-    QUESTION_PATTERNS = {
-        "work_authorization": [
-            r"authorized.*work",
-            r"legal.*work",
-            r"visa.*status",
-            r"work.*permit",
-            r"employment.*eligibility"
-        ],
-        "relocation": [
-            r"willing.*relocate",
-            r"open.*relocation",
-            r"relocate.*position"
-        ],
-        "start_date": [
-            r"when.*start",
-            r"availability",
-            r"start.*date",
-            r"earliest.*start"
-        ],
-        "salary_expectation": [
-            r"salary.*expectation",
-            r"expected.*salary",
-            r"compensation.*expect",
-            r"desired.*salary"
-        ],
-        "why_interested": [
-            r"why.*interested",
-            r"why.*apply",
-            r"why.*want.*work",
-            r"what.*interest"
-        ],
-        "why_leaving": [
-            r"why.*leaving",
-            r"reason.*leave",
-            r"leaving.*current"
-        ],
-        "strengths": [
-            r"greatest.*strength",
-            r"your.*strength",
-            r"best.*qualities"
-        ],
-        "weaknesses": [
-            r"greatest.*weakness",
-            r"your.*weakness",
-            r"areas.*improve"
-        ],
-        "experience_years": [
-            r"years.*experience",
-            r"how.*long.*experience",
-            r"experience.*years"
-        ],
-        "remote_preference": [
-            r"remote.*work",
-            r"work.*remote",
-            r"hybrid.*office",
-            r"on-?site.*remote"
-        ],
-        "referral": [
-            r"how.*hear",
-            r"referred.*by",
-            r"learn.*about.*position"
-        ],
-        "travel": [
-            r"willing.*travel",
-            r"travel.*requirement",
-            r"open.*travel"
-        ]
+    QUESTION_PATTERNS: ClassVar[Dict[str, List[str]]] = QUESTION_PATTERNS
+
+    # Answers that do not depend on the user or job
+    _STATIC_ANSWERS: ClassVar[Dict[QType, str]] = {
+        QType.WORK_AUTHORIZATION: "Yes, I am authorized to work in the United States.",
+        QType.START_DATE: "I am available to start within 2-4 weeks, depending on the offer timeline.",
+        QType.WHY_LEAVING: (
+            "I am looking for new challenges and opportunities for professional growth. "
+            "While I have valued my current position, I am excited to take on more "
+            "responsibility and contribute to a new team."
+        ),
+        QType.WEAKNESSES: (
+            "I sometimes tend to be overly thorough, which can impact my speed on initial tasks. "
+            "However, I've been working on finding the right balance between quality and efficiency "
+            "by setting clear priorities and time limits for each task."
+        ),
+        QType.REFERRAL: (
+            "I discovered this opportunity through your company's careers page "
+            "while researching opportunities in this field."
+        ),
+        QType.TRAVEL: (
+            "Yes, I am willing to travel as needed for the role, including occasional "
+            "trips for team meetings or client visits."
+        ),
     }
 
+    # Batches at least this large are deduplicated before classification
+    LARGE_BATCH_THRESHOLD: ClassVar[int] = 64
+
+    # Opening sentence of custom responses for each supported tone
+    _TONE_PREFIX: ClassVar[Dict[str, str]] = {
+        "enthusiastic": "I'm excited to address this!",
+        "professional": "Thank you for this question.",
+    }
+
+    # Fallback answer for questions that match no known type
+    _GENERIC_ANSWER: ClassVar[str] = (
+        "Thank you for the question. Based on my background and experience, "
+        "I believe I can provide valuable insights on this topic. "
+        "I would be happy to discuss this further during an interview."
+    )
+
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute QA tasks"""
         action = task.get("action", "")
@@ -123,20 +434,21 @@ class QAAgent(BaseAgent):
 
         user = self.database.get_user(user_id) if user_id else {}
         job = self.database.get_job(job_id) if job_id else {}
+        ctx = UserContext.from_user(user)
 
         # Classify the question
         question_type = self._classify_question_type(question)
 
         # Generate answer
-        answer = self._generate_answer(question, question_type, user, job)
+        answer = self._generate_answer(question, question_type, ctx, job)
 
         return self.create_output(
             action="question_answered",
             output_data={
                 "question": question,
-                "question_type": question_type,
+                "question_type": question_type.label if question_type else None,
                 "answer": answer,
-                "confidence": self._get_confidence(question_type, user)
+                "confidence": self._get_confidence(question_type, ctx)
             }
         )
 
@@ -154,16 +466,17 @@ class QAAgent(BaseAgent):
 
         user = self.database.get_user(user_id) if user_id else {}
         job = self.database.get_job(job_id) if job_id else {}
+        ctx = UserContext.from_user(user)
 
         answers = []
-        for question in questions:
-            question_type = self._classify_question_type(question)
-            answer = self._generate_answer(question, question_type, user, job)
+        question_types = self._classify_question_types(questions)
+        for question, question_type in zip(questions, question_types):
+            answer = self._generate_answer(question, question_type, ctx, job)
             answers.append({
                 "question": question,
-                "question_type": question_type,
+                "question_type": question_type.label if question_type else None,
                 "answer": answer,
-                "confidence": self._get_confidence(question_type, user)
+                "confidence": self._get_confidence(question_type, ctx)
             })
 
         return self.create_output(
@@ -185,7 +498,7 @@ class QAAgent(BaseAgent):
             action="question_classified",
             output_data={
                 "question": question,
-                "type": question_type,
+                "type": question_type.label if question_type else None,
                 "is_common": question_type is not None
             }
         )
@@ -199,9 +512,10 @@ class QAAgent(BaseAgent):
         key_points = task.get("key_points", [])
 
         user = self.database.get_user(user_id) if user_id else {}
+        ctx = UserContext.from_user(user)
 
         response = self._create_custom_response(
-            question, user, tone, max_length, key_points
+            question, ctx, tone, max_length, key_points
         )
 
         return self.create_output(
@@ -209,193 +523,143 @@ class QAAgent(BaseAgent):
             output_data={
                 "question": question,
                 "response": response,
-                "word_count": len(response.split())
+                "word_count": response.count(" ") + 1 if response else 0
             }
         )
 
-    def _classify_question_type(self, question: str) -> Optional[str]:
+    def _classify_question_type(self, question: str) -> Optional[QType]:
         """Classify question into a known type"""
-        question_lower = question.lower()
-
-        for q_type, patterns in self.QUESTION_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, question_lower):
-                    return q_type
-
-        return None
+        return _classify(question)
+
+    def _classify_question_types(self, questions: List[str]) -> List[Optional[QType]]:
+        """Classify a batch of questions with one scan over their joined text"""
+        if len(questions) >= self.LARGE_BATCH_THRESHOLD:
+            # Scraped questionnaires repeat the same questions many times over
+            unique = list(dict.fromkeys(questions))
+            if len(unique) < len(questions):
+                types_by_question = dict(zip(unique, self._classify_question_types(unique)))
+                return [types_by_question[question] for question in questions]
+
+        question_types = [_fast_classify(question) for question in questions]
+        indices = []
+        for i, (question, q_type) in enumerate(zip(questions, question_types)):
+            if q_type is not None or not _may_match(question):
+                continue
+            if QUESTION_SEPARATOR in question:
+                # Would split in the joined text; classify it on its own
+                question_types[i] = _classify(question)
+            else:
+                indices.append(i)
+        if not indices:
+            return question_types
+
+        pieces = [questions[i] for i in indices]
+        joined = QUESTION_SEPARATOR + QUESTION_SEPARATOR.join(pieces)
+        # Offset of the separator in front of each question
+        offsets = accumulate((len(piece) + 1 for piece in pieces[:-1]), initial=0)
+        index_at = dict(zip(offsets, indices))
+
+        for match in _BATCH_COMPILED.finditer(joined):
+            question_types[index_at[match.start()]] = _QTYPE_BY_LABEL[match.lastgroup]
+
+        return question_types
 
     def _generate_answer(
         self,
         question: str,
-        question_type: Optional[str],
-        user: Dict,
+        question_type: Optional[QType],
+        ctx: UserContext,
         job: Dict
     ) -> str:
         """Generate answer based on question type and user data"""
-        personal = user.get("personal", {})
-        prefs = user.get("job_preferences", {})
-        resume = user.get("resume", {}).get("parsed", {})
-
-        if question_type == "work_authorization":
-            return "Yes, I am authorized to work in the United States."
-
-        elif question_type == "relocation":
-            remote_pref = prefs.get("remote_preference", "any")
-            if remote_pref == "remote_only":
-                return "I am seeking remote positions and am not looking to relocate at this time."
-            return "Yes, I am open to relocation for the right opportunity."
-
-        elif question_type == "start_date":
-            return "I am available to start within 2-4 weeks, depending on the offer timeline."
-
-        elif question_type == "salary_expectation":
-            min_sal = prefs.get("salary_min")
-            max_sal = prefs.get("salary_max")
-            if min_sal and max_sal:
-                return (
-                    f"Based on my experience and market research, I am looking for compensation "
-                    f"in the range of ${min_sal:,} to ${max_sal:,}. However, I am open to "
-                    f"discussing this based on the total compensation package."
-                )
-            elif min_sal:
-                return (
-                    f"I am looking for compensation of ${min_sal:,} or above, depending on "
-                    f"the full benefits and growth opportunities."
-                )
-            return (
-                "I am open to discussing compensation based on the role responsibilities "
-                "and the total package offered."
-            )
-
-        elif question_type == "why_interested":
-            company = job.get("company", "this company")
-            title = job.get("title", "this role")
-            return (
-                f"I am excited about the {title} opportunity at {company} because it aligns "
-                f"perfectly with my skills and career goals. The company's mission and the "
-                f"innovative work being done here particularly appeal to me."
-            )
+        static_answer = self._STATIC_ANSWERS.get(question_type)
+        if static_answer is not None:
+            return static_answer
 
-        elif question_type == "why_leaving":
-            return (
-                "I am looking for new challenges and opportunities for professional growth. "
-                "While I have valued my current position, I am excited to take on more "
-                "responsibility and contribute to a new team."
-            )
+        handler = self._dynamic_answers.get(question_type)
+        if handler is not None:
+            return handler(ctx, job)
 
-        elif question_type == "strengths":
-            skills = resume.get("skills", {})
-            technical = skills.get("technical", [])[:3] if isinstance(skills, dict) else []
-            if technical:
-                return (
-                    f"My greatest strengths include my technical expertise in {', '.join(technical)}, "
-                    f"strong problem-solving abilities, and my commitment to delivering high-quality work. "
-                    f"I also excel at collaborating with cross-functional teams."
-                )
-            return (
-                "My greatest strengths include strong problem-solving skills, attention to detail, "
-                "and the ability to learn quickly. I am also known for my collaborative approach "
-                "and clear communication."
-            )
-
-        elif question_type == "weaknesses":
+        # Default response for unknown question types
+        return self._generate_generic_response(question, ctx, job)
+
+    def _ans_relocation(self, ctx: UserContext, job: Dict) -> str:
+        """Answer a relocation question"""
+        if ctx.remote_pref == "remote_only":
+            return "I am seeking remote positions and am not looking to relocate at this time."
+        return "Yes, I am open to relocation for the right opportunity."
+
+    def _ans_salary(self, ctx: UserContext, job: Dict) -> str:
+        """Answer a salary expectation question"""
+        return _format_salary(ctx.salary_min, ctx.salary_max)
+
+    def _ans_why_interested(self, ctx: UserContext, job: Dict) -> str:
+        """Answer a why-are-you-interested question"""
+        return _why_interested(job.get("company", "this company"), job.get("title", "this role"))
+
+    def _ans_strengths(self, ctx: UserContext, job: Dict) -> str:
+        """Answer a strengths question"""
+        technical = ctx.technical_skills[:3]
+        if technical:
             return (
-                "I sometimes tend to be overly thorough, which can impact my speed on initial tasks. "
-                "However, I've been working on finding the right balance between quality and efficiency "
-                "by setting clear priorities and time limits for each task."
+                f"My greatest strengths include my technical expertise in {', '.join(technical)}, "
+                f"strong problem-solving abilities, and my commitment to delivering high-quality work. "
+                f"I also excel at collaborating with cross-functional teams."
             )
+        return (
+            "My greatest strengths include strong problem-solving skills, attention to detail, "
+            "and the ability to learn quickly. I am also known for my collaborative approach "
+            "and clear communication."
+        )
 
-        elif question_type == "experience_years":
-            experience = resume.get("experience", [])
-            years = len(experience) * 2 if experience else 0
-            return f"I have approximately {years} years of professional experience in this field."
-
-        elif question_type == "remote_preference":
-            remote_pref = prefs.get("remote_preference", "any")
-            if remote_pref == "remote_only":
-                return "I prefer to work fully remote but am flexible for occasional in-person meetings."
-            elif remote_pref == "hybrid_ok":
-                return "I am comfortable with a hybrid arrangement and can work both remotely and in-office."
-            return "I am flexible and can adapt to remote, hybrid, or on-site work arrangements."
-
-        elif question_type == "referral":
-            return "I discovered this opportunity through your company's careers page while researching opportunities in this field."
-
-        elif question_type == "travel":
-            return "Yes, I am willing to travel as needed for the role, including occasional trips for team meetings or client visits."
+    def _ans_experience_years(self, ctx: UserContext, job: Dict) -> str:
+        """Answer a years-of-experience question"""
+        return (
+            f"I have approximately {ctx.experience_years} years of professional "
+            f"experience in this field."
+        )
 
-        # Default response for unknown question types
-        return self._generate_generic_response(question, user, job)
+    def _ans_remote_preference(self, ctx: UserContext, job: Dict) -> str:
+        """Answer a remote work preference question"""
+        if ctx.remote_pref == "remote_only":
+            return "I prefer to work fully remote but am flexible for occasional in-person meetings."
+        elif ctx.remote_pref == "hybrid_ok":
+            return "I am comfortable with a hybrid arrangement and can work both remotely and in-office."
+        return "I am flexible and can adapt to remote, hybrid, or on-site work arrangements."
 
     def _generate_generic_response(
         self,
         question: str,
-        user: Dict,
+        ctx: UserContext,
         job: Dict
     ) -> str:
         """Generate a generic response for unrecognized questions"""
-        personal = user.get("personal", {})
-        name = personal.get("name", "").split()[0] if personal.get("name") else ""
-
-        return (
-            f"Thank you for the question. Based on my background and experience, "
-            f"I believe I can provide valuable insights on this topic. "
-            f"I would be happy to discuss this further during an interview."
-        )
+        return self._GENERIC_ANSWER
 
-    def _get_confidence(self, question_type: Optional[str], user: Dict) -> str:
+    def _get_confidence(self, question_type: Optional[QType], ctx: UserContext) -> str:
         """Get confidence level for the answer"""
-        if question_type is None:
-            return "low"
-
-        # Check if we have user data for this question type
-        prefs = user.get("job_preferences", {})
-        resume = user.get("resume", {}).get("parsed", {})
-
-        if question_type == "salary_expectation":
-            if prefs.get("salary_min"):
-                return "high"
-            return "medium"
-
-        if question_type == "experience_years":
-            if resume.get("experience"):
-                return "high"
-            return "medium"
-
-        if question_type in ["work_authorization", "start_date", "referral"]:
-            return "medium"
-
-        return "high"
+        key = (question_type, bool(ctx.salary_min), ctx.experience_years > 0)
+        return _CONFIDENCE.get(key, "high")
 
     def _create_custom_response(
         self,
         question: str,
-        user: Dict,
+        ctx: UserContext,
         tone: str,
         max_length: int,
         key_points: List[str]
     ) -> str:
         """Create a custom response with specific parameters"""
-        personal = user.get("personal", {})
-        resume = user.get("resume", {}).get("parsed", {})
-
         # Build response incorporating key points
-        response_parts = []
-
-        if tone == "enthusiastic":
-            response_parts.append("I'm excited to address this!")
-        elif tone == "professional":
-            response_parts.append("Thank you for this question.")
-
-        for point in key_points:
-            response_parts.append(point)
-
-        response = " ".join(response_parts)
-
-        # Truncate if needed
-        words = response.split()
-        if len(words) > max_length // 5:  # Rough word limit
-            words = words[:max_length // 5]
-            response = " ".join(words) + "..."
+        prefix = self._TONE_PREFIX.get(tone)
+        response = " ".join((prefix, *key_points) if prefix else key_points)
+
+        # Truncate if needed, cutting at the space that ends the last allowed word
+        word_limit = max_length // 5  # Rough word limit
+        if response and response.count(" ") >= word_limit:
+            end = -1
+            for _ in range(word_limit):
+                end = response.find(" ", end + 1)
+            response = response[:max(end, 0)] + "..."
 
         return response
@@ -1,7 +1,16 @@
 """Resume Parser Agent - Extracts structure from resumes"""
 
+import codecs
+import copy
+import mmap
+import os
 import re
-from typing import Any, Dict, List, Optional
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from hashlib import blake2b
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 
 from ..core.base_agent import BaseAgent
@@ -9,17 +18,108 @@ from ..core.registry import AgentRegistry
 from ..schemas import AgentOutput, ParsedResume, Experience, Education, Project, Skills
 
 
+# Runs of word characters, used to tokenize resume text
+_WORD_RE = re.compile(r"\w+")
+
+# Section header keywords, checked against short lines
+_SECTION_KEYWORDS = {
+    "summary": r"summary|objective|profile|about",
+    "experience": r"experience|employment|work history|professional experience",
+    "education": r"education|academic|qualifications",
+    "skills": r"skills|technical skills|competencies|technologies",
+    "certifications": r"certifications|certificates|licenses",
+    "projects": r"projects|portfolio|personal projects"
+}
+_SECTION_PATTERNS = {
+    name: re.compile(f"(?i)({keywords})") for name, keywords in _SECTION_KEYWORDS.items()
+}
+# Matches any section header keyword, so most lines need a single search
+_ANY_SECTION_RE = re.compile(f"(?i){'|'.join(_SECTION_KEYWORDS.values())}")
+# Lines mentioning another section end the summary
+_SUMMARY_STOP_RE = re.compile(r"(?i)experience|education|skills")
+
+# Job entry and date range patterns
+_JOB_RE = re.compile(r"(?P<title>[\w\s]+)\s*(?:at|@|-|,)\s*(?P<company>[\w\s&.]+)")
+# A date range, which marks its line as the start of a new job entry.
+# Whitespace is matched with [^\S\n] so a range never spans two lines, and
+# the leading \b skips starts inside words, where no leftmost match begins.
+_DATE_RANGE_RE = re.compile(
+    r"\b(\d{4}|\w+[^\S\n]*\d{4})[^\S\n]*[-–to]+[^\S\n]*"
+    r"(\d{4}|\w+[^\S\n]*\d{4}|present|current)",
+    re.IGNORECASE
+)
+# A bullet or numbered line; the lookahead-backreference pair makes the
+# marker run atomic so it is stripped whole, as with str.lstrip
+_BULLET_LINE_RE = re.compile(
+    r"^[^\S\n]*(?=[•\-*–]|\d+\.)(?=(?P<marker>[•\-*–\d.]+))(?P=marker)"
+    r"[^\S\n]*(?P<bullet>\S(?:.*\S)?)[^\S\n]*$",
+    re.MULTILINE
+)
+_PROJECT_BULLET_MARKERS = '•-*'
+_PROJECT_BULLET_CHARS = frozenset(_PROJECT_BULLET_MARKERS)
+
+# Education patterns
+_DEGREE_RE = re.compile(r"(?i)(bachelor|master|ph\.?d|mba|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?)")
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+_INSTITUTION_RES = [
+    re.compile(r"(?i)(?:at|from)\s+([\w\s]+(?:University|College|Institute|School))"),
+    re.compile(r"([\w\s]+(?:University|College|Institute|School))")
+]
+
+# Certification patterns
+_CERT_RES = [
+    re.compile(r"(?i)(AWS|Azure|GCP|Google Cloud)[\w\s]+(?:Certified|Certification)"),
+    re.compile(r"(?i)(?:Certified|Certification)[\w\s]+"),
+    re.compile(r"(?i)PMP|CISSP|CCNA|CCNP|CompTIA[\w\s]+")
+]
+
+# Skills list each term is reported in; concepts are keywords only
+_TECHNICAL, _TOOLS, _SOFT, _KEYWORD_ONLY = 0, 1, 2, -1
+_CATEGORY_FIELDS = {
+    "languages": _TECHNICAL,
+    "frameworks": _TECHNICAL,
+    "tools": _TOOLS,
+    "databases": _TOOLS,
+}
+
+
+def _build_term_table(
+    tech_keywords: Dict[str, List[str]],
+    soft_skills: List[str]
+) -> Tuple[Tuple[str, ...], "array[int]"]:
+    """Flatten skill terms into parallel arrays of terms and Skills list indexes"""
+    terms = []
+    fields = array("b")
+    for category, category_terms in tech_keywords.items():
+        for term in category_terms:
+            terms.append(term)
+            fields.append(_CATEGORY_FIELDS.get(category, _KEYWORD_ONLY))
+    for term in soft_skills:
+        terms.append(term)
+        fields.append(_SOFT)
+    return tuple(terms), fields
+
+
 @AgentRegistry.register
 class ResumeParserAgent(BaseAgent):
     """Agent responsible for parsing and extracting resume information"""
 
-    @property
-    def name(self) -> str:
-        return "RESUME_PARSER_AGENT"
+    # Number of recently parsed resumes kept for repeat submissions
+    PARSE_CACHE_SIZE = 64
+
+    # Batches smaller than PARALLEL_THRESHOLD are parsed inline, since
+    # starting worker processes costs more than it saves
+    PARALLEL_THRESHOLD = 16
+    MAX_WORKERS = os.cpu_count() or 1
+    BATCH_CHUNK_SIZE = 4
 
-    @property
-    def description(self) -> str:
-        return "Extracts structured information from resumes"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Content digest -> parsed resume, least recently used first
+        self._parse_cache: "OrderedDict[bytes, ParsedResume]" = OrderedDict()
+
+    NAME = "RESUME_PARSER_AGENT"
+    DESCRIPTION = "Extracts structured information from resumes"
 
     # Common technical keywords for extraction
     TECH_KEYWORDS = {
@@ -35,12 +135,32 @@ class ResumeParserAgent(BaseAgent):
                     "machine learning", "deep learning", "data science"]
     }
 
+    SOFT_SKILLS = [
+        "leadership", "communication", "teamwork", "problem-solving",
+        "analytical", "project management", "collaboration", "mentoring"
+    ]
+
+    # Flat, category-ordered term table with a parallel array of field indexes
+    _KW_TERMS, _KW_FIELDS = _build_term_table(TECH_KEYWORDS, SOFT_SKILLS)
+
+    # Every term looked for in resume text, each matched only as a whole word.
+    # Single-word terms are found by intersecting with the text's word set;
+    # terms with spaces or punctuation are scanned for individually.
+    _ALL_TERMS = tuple(dict.fromkeys(_KW_TERMS))
+    _WORD_TERMS = frozenset(term for term in _ALL_TERMS if _WORD_RE.fullmatch(term))
+    _PHRASE_PATTERNS = {
+        term: re.compile(r"(?<!\w)" + re.escape(term) + r"(?!\w)")
+        for term in _ALL_TERMS if not _WORD_RE.fullmatch(term)
+    }
+
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute resume parsing tasks"""
         action = task.get("action", "parse_resume")
 
         if action == "parse_resume":
             return self._parse_resume(task)
+        elif action == "parse_batch":
+            return self._parse_batch(task)
         elif action == "extract_keywords":
             return self._extract_keywords(task)
         elif action == "analyze_skills":
@@ -68,39 +188,81 @@ class ResumeParserAgent(BaseAgent):
             )
 
         # Parse the resume
-        parsed = self._extract_resume_data(resume_text)
+        parsed = self._parse_cached(resume_text)
+        parsed_dict = parsed.to_dict()
 
         # Update user profile if user_id provided
         if user_id:
             profile = self.database.get_user(user_id)
             if profile:
-                profile["resume"]["parsed"] = parsed.to_dict()
-                profile["resume"]["raw_text"] = resume_text
-                if resume_path:
-                    profile["resume"]["file_path"] = resume_path
-                self.database.save_user(user_id, profile)
+                resume = profile["resume"]
+                # Re-parsing an unchanged resume leaves nothing to write
+                unchanged = (
+                    resume.get("raw_text") == resume_text
+                    and (not resume_path or resume.get("file_path") == resume_path)
+                    and resume.get("parsed") == parsed_dict
+                )
+                if not unchanged:
+                    resume["parsed"] = parsed_dict
+                    resume["raw_text"] = resume_text
+                    if resume_path:
+                        resume["file_path"] = resume_path
+                    self.database.save_user(user_id, profile)
 
         return self.create_output(
             action="resume_parsed",
             output_data={
                 "user_id": user_id,
-                "parsed_resume": parsed.to_dict(),
+                "parsed_resume": parsed_dict,
                 "summary_stats": {
                     "experience_count": len(parsed.experience),
                     "education_count": len(parsed.education),
-                    "skills_count": sum([
-                        len(parsed.skills.technical),
-                        len(parsed.skills.tools),
-                        len(parsed.skills.soft)
-                    ]),
+                    "skills_count": (
+                        len(parsed.skills.technical)
+                        + len(parsed.skills.tools)
+                        + len(parsed.skills.soft)
+                    ),
                     "keywords_count": len(parsed.extracted_keywords)
                 }
             },
             save_to_memory={
-                f"users.{user_id}.resume.parsed": parsed.to_dict()
+                f"users.{user_id}.resume.parsed": parsed_dict
             } if user_id else None
         )
 
+    def _parse_batch(self, task: Dict[str, Any]) -> AgentOutput:
+        """Parse many resume texts, spreading large batches over worker processes"""
+        resumes = task.get("resumes", [])
+
+        if len(resumes) < self.PARALLEL_THRESHOLD or self.MAX_WORKERS <= 1:
+            parsed_resumes = [self._parse_cached(text).to_dict() for text in resumes]
+        else:
+            with ProcessPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                parsed_resumes = list(executor.map(
+                    partial(_parse_one, type(self)), resumes,
+                    chunksize=self.BATCH_CHUNK_SIZE
+                ))
+
+        return self.create_output(
+            action="resumes_parsed",
+            output_data={"parsed_resumes": parsed_resumes, "count": len(parsed_resumes)}
+        )
+
+    def _parse_cached(self, text: str) -> ParsedResume:
+        """Parse resume text, reusing the result for recently seen text"""
+        key = blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        parsed = self._parse_cache.get(key)
+        if parsed is not None:
+            self._parse_cache.move_to_end(key)
+        else:
+            parsed = self._extract_resume_data(text)
+            self._parse_cache[key] = parsed
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        # Callers get their own copy; to_dict() shares the lists it holds
+        return copy.deepcopy(parsed)
+
     def _load_resume_file(self, file_path: str) -> str:
         """Load resume from file"""
         path = Path(file_path)
@@ -109,273 +271,289 @@ class ResumeParserAgent(BaseAgent):
 
         try:
             # Handle different file types
-            if path.suffix.lower() == ".txt":
-                return path.read_text()
-            elif path.suffix.lower() == ".pdf":
-                # Placeholder for PDF parsing
+            suffix = path.suffix.lower()
+            if suffix == ".pdf":
                 return self._parse_pdf(path)
-            elif path.suffix.lower() in [".doc", ".docx"]:
-                # Placeholder for Word doc parsing
+            elif suffix == ".docx":
                 return self._parse_docx(path)
+            elif suffix == ".doc":
+                # python-docx cannot read binary Word 97 documents
+                return f"[DOCX content from {path}]"
             else:
-                return path.read_text()
+                return self._read_text(path)
         except Exception as e:
             self.logger.error(f"Error loading resume: {e}")
             return ""
 
+    def _read_text(self, path: Path) -> str:
+        """Read a text file by decoding its memory-mapped bytes"""
+        with open(path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    text = codecs.decode(mapped, "utf-8", "replace")
+            except (ValueError, OSError):
+                # Empty files cannot be mapped, and not every file system supports it
+                return path.read_text(errors="replace")
+
+        # Match the newline translation of text-mode reads
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
     def _parse_pdf(self, path: Path) -> str:
-        """Parse PDF file (placeholder - would use pdfplumber/PyPDF2 in production)"""
-        # In production, use: import pdfplumber
-        return f"[PDF content from {path}]"
+        """Parse PDF file with pdfplumber (placeholder text if it is not installed)"""
+        try:
+            import pdfplumber
+        except ImportError:
+            return f"[PDF content from {path}]"
+
+        with pdfplumber.open(path) as pdf:
+            return "\n".join(page.extract_text() or "" for page in pdf.pages)
 
     def _parse_docx(self, path: Path) -> str:
-        """Parse Word document (placeholder - would use python-docx in production)"""
-        # In production, use: import docx
-        return f"[DOCX content from {path}]"
+        """Parse Word document with python-docx (placeholder text if it is not installed)"""
+        try:
+            import docx
+        except ImportError:
+            return f"[DOCX content from {path}]"
+
+        document = docx.Document(str(path))
+        return "\n".join(paragraph.text for paragraph in document.paragraphs)
 
-    def _extract_resume_data(self, text: str) -> ParsedResume:
+    @classmethod
+    def _extract_resume_data(cls, text: str) -> ParsedResume:
         """Extract structured data from resume text"""
         parsed = ParsedResume()
+        lines = text.split('\n')
 
         # Extract sections
-        sections = self._identify_sections(text)
+        sections = cls._identify_sections(lines)
 
         # Extract summary
-        parsed.summary = self._extract_summary(text, sections)
+        parsed.summary = cls._extract_summary(text, lines, sections)
 
         # Extract experience
-        parsed.experience = self._extract_experience(text, sections)
+        parsed.experience = cls._extract_experience(text, lines, sections)
 
         # Extract education
-        parsed.education = self._extract_education(text, sections)
+        parsed.education = cls._extract_education(text, lines, sections)
+
+        # Match known terms once for both skills and keywords
+        found_terms = cls._find_terms(text)
 
         # Extract skills
-        parsed.skills = self._extract_skills(text, sections)
+        parsed.skills = cls._extract_skills(text, sections, found_terms)
 
         # Extract certifications
-        parsed.certifications = self._extract_certifications(text, sections)
+        parsed.certifications = cls._extract_certifications(text, sections)
 
         # Extract projects
-        parsed.projects = self._extract_projects(text, sections)
+        parsed.projects = cls._extract_projects(text, lines, sections)
 
         # Extract keywords
-        parsed.extracted_keywords = self._extract_all_keywords(text)
+        parsed.extracted_keywords = cls._extract_all_keywords(text, found_terms)
 
         return parsed
 
-    def _identify_sections(self, text: str) -> Dict[str, tuple]:
+    @classmethod
+    def _identify_sections(cls, lines: List[str]) -> Dict[str, tuple]:
         """Identify section boundaries in the resume"""
-        section_patterns = {
-            "summary": r"(?i)(summary|objective|profile|about)",
-            "experience": r"(?i)(experience|employment|work history|professional experience)",
-            "education": r"(?i)(education|academic|qualifications)",
-            "skills": r"(?i)(skills|technical skills|competencies|technologies)",
-            "certifications": r"(?i)(certifications|certificates|licenses)",
-            "projects": r"(?i)(projects|portfolio|personal projects)"
-        }
-
         sections = {}
-        lines = text.split('\n')
 
         for i, line in enumerate(lines):
-            for section_name, pattern in section_patterns.items():
-                if re.search(pattern, line) and len(line.strip()) < 50:
+            if len(line.strip()) >= 50 or not _ANY_SECTION_RE.search(line):
+                continue
+            # A header can name several sections, e.g. "Skills & Certifications"
+            for section_name, pattern in _SECTION_PATTERNS.items():
+                if pattern.search(line):
                     sections[section_name] = i
 
         return sections
 
-    def _extract_summary(self, text: str, sections: Dict) -> str:
+    @classmethod
+    def _extract_summary(cls, text: str, lines: List[str], sections: Dict) -> str:
         """Extract professional summary"""
         # Simple extraction - take first few sentences if no explicit section
-        lines = text.split('\n')
-        summary_lines = []
-
         start_idx = sections.get("summary", 0)
-        end_idx = min(start_idx + 5, len(lines))
+        window = lines[start_idx:start_idx + 5]
+
+        # Usually no line in the window names another section, so screen the
+        # whole window once before filtering line by line
+        if not _SUMMARY_STOP_RE.search("\n".join(window)):
+            summary_lines = [line.strip() for line in window]
+            return " ".join(filter(None, summary_lines))[:500]
 
-        for line in lines[start_idx:end_idx]:
+        summary_lines = []
+        for line in window:
             line = line.strip()
-            if line and not any(
-                re.search(r"(?i)" + p, line)
-                for p in ["experience", "education", "skills"]
-            ):
+            if line and not _SUMMARY_STOP_RE.search(line):
                 summary_lines.append(line)
 
         return " ".join(summary_lines)[:500]
 
-    def _extract_experience(self, text: str, sections: Dict) -> List[Experience]:
+    @classmethod
+    def _extract_experience(
+        cls,
+        text: str,
+        lines: List[str],
+        sections: Dict
+    ) -> List[Experience]:
         """Extract work experience"""
         experiences = []
 
-        # Pattern for job entries
-        job_pattern = r"(?P<title>[\w\s]+)\s*(?:at|@|-|,)\s*(?P<company>[\w\s&.]+)"
-        date_pattern = r"(\d{4}|\w+\s*\d{4})\s*[-–to]+\s*(\d{4}|\w+\s*\d{4}|present|current)"
-
-        lines = text.split('\n')
-        current_job = None
-        current_bullets = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check for date range (indicates new job entry)
-            date_match = re.search(date_pattern, line, re.IGNORECASE)
-            if date_match:
-                # Save previous job if exists
-                if current_job:
-                    experiences.append(Experience(
-                        company=current_job.get("company", ""),
-                        title=current_job.get("title", ""),
-                        duration=current_job.get("duration", ""),
-                        bullets=current_bullets
-                    ))
-                    current_bullets = []
-
-                # Start new job
-                duration = f"{date_match.group(1)} - {date_match.group(2)}"
-                job_match = re.search(job_pattern, line)
-                current_job = {
-                    "title": job_match.group("title").strip() if job_match else "",
-                    "company": job_match.group("company").strip() if job_match else "",
-                    "duration": duration
-                }
-
-            # Check for bullet points
-            elif line.startswith(('•', '-', '*', '–')) or re.match(r'^\d+\.', line):
-                bullet = re.sub(r'^[•\-*–\d.]+\s*', '', line)
-                if bullet:
-                    current_bullets.append(bullet)
-
-        # Save last job
-        if current_job:
+        # Each line holding a date range starts a job; bullet lines up to the
+        # next one belong to it. Bullets above the first job are credited to it.
+        headers = []
+        pos = 0
+        while True:
+            date_match = _DATE_RANGE_RE.search(text, pos)
+            if not date_match:
+                break
+            line_start = text.rfind('\n', 0, date_match.start()) + 1
+            line_end = text.find('\n', date_match.end())
+            if line_end == -1:
+                line_end = len(text)
+            headers.append((line_start, line_end, date_match))
+            pos = line_end + 1
+
+        bullet_start = 0
+        for i, (line_start, line_end, date_match) in enumerate(headers):
+            bullet_end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+            bullets = [
+                match.group("bullet")
+                for span in (text[bullet_start:line_start], text[line_end:bullet_end])
+                for match in _BULLET_LINE_RE.finditer(span)
+            ]
+            bullet_start = bullet_end
+
+            job_match = _JOB_RE.search(text[line_start:line_end].strip())
             experiences.append(Experience(
-                company=current_job.get("company", ""),
-                title=current_job.get("title", ""),
-                duration=current_job.get("duration", ""),
-                bullets=current_bullets
+                company=job_match.group("company").strip() if job_match else "",
+                title=job_match.group("title").strip() if job_match else "",
+                duration=f"{date_match.group(1)} - {date_match.group(2)}",
+                bullets=bullets
             ))
 
         return experiences[:10]  # Limit to 10 entries
 
-    def _extract_education(self, text: str, sections: Dict) -> List[Education]:
+    @classmethod
+    def _extract_education(
+        cls,
+        text: str,
+        lines: List[str],
+        sections: Dict
+    ) -> List[Education]:
         """Extract education information"""
         education = []
+        pos = 0
+
+        # Jump between degree keywords in the whole text rather than testing
+        # every line; each hit is expanded to its line and the line skipped
+        while len(education) < 5:  # Limit to 5 entries
+            degree_match = _DEGREE_RE.search(text, pos)
+            if not degree_match:
+                break
+
+            start = text.rfind('\n', 0, degree_match.start()) + 1
+            end = text.find('\n', degree_match.end())
+            if end < 0:
+                end = len(text)
+            pos = end + 1
+
+            line = text[start:end].strip()
+            year_match = _YEAR_RE.search(line)
+            education.append(Education(
+                institution=cls._extract_institution(line),
+                degree=line[:100],
+                year=year_match.group(0) if year_match else ""
+            ))
 
-        degree_patterns = [
-            r"(?P<degree>(?:Bachelor|Master|Ph\.?D|MBA|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?)[\w\s]*)",
-            r"(?P<institution>University|College|Institute|School)[\w\s]*",
-        ]
-
-        year_pattern = r"(19|20)\d{2}"
-
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Look for degree keywords
-            degree_match = re.search(
-                r"(?i)(bachelor|master|ph\.?d|mba|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?)",
-                line
-            )
-            if degree_match:
-                year_match = re.search(year_pattern, line)
-                education.append(Education(
-                    institution=self._extract_institution(line),
-                    degree=line[:100],
-                    year=year_match.group(0) if year_match else ""
-                ))
-
-        return education[:5]  # Limit to 5 entries
+        return education
 
-    def _extract_institution(self, text: str) -> str:
+    @classmethod
+    def _extract_institution(cls, text: str) -> str:
         """Extract institution name from text"""
-        patterns = [
-            r"(?i)(?:at|from)\s+([\w\s]+(?:University|College|Institute|School))",
-            r"([\w\s]+(?:University|College|Institute|School))"
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _INSTITUTION_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
         return ""
 
-    def _extract_skills(self, text: str, sections: Dict) -> Skills:
-        """Extract skills from resume"""
+    @classmethod
+    def _find_terms(cls, text: str) -> FrozenSet[str]:
+        """Find which known skill and keyword terms occur in the text as whole words"""
         text_lower = text.lower()
-        skills = Skills()
-
-        # Technical skills
-        for lang in self.TECH_KEYWORDS["languages"]:
-            if lang in text_lower:
-                skills.technical.append(lang)
-
-        for framework in self.TECH_KEYWORDS["frameworks"]:
-            if framework in text_lower:
-                skills.technical.append(framework)
-
-        # Tools
-        for tool in self.TECH_KEYWORDS["tools"]:
-            if tool in text_lower:
-                skills.tools.append(tool)
+        found = cls._WORD_TERMS.intersection(_WORD_RE.findall(text_lower))
+        # The substring test is a cheap screen; the pattern rejects hits inside
+        # longer words, such as "c++" in "c++11"
+        return found.union(
+            term for term, pattern in cls._PHRASE_PATTERNS.items()
+            if term in text_lower and pattern.search(text_lower)
+        )
 
-        for db in self.TECH_KEYWORDS["databases"]:
-            if db in text_lower:
-                skills.tools.append(db)
+    @classmethod
+    def _extract_skills(
+        cls,
+        text: str,
+        sections: Dict,
+        found_terms: Optional[FrozenSet[str]] = None
+    ) -> Skills:
+        """Extract skills from resume"""
+        if found_terms is None:
+            found_terms = cls._find_terms(text)
+        skills = Skills()
 
-        # Soft skills (simple pattern matching)
-        soft_skill_patterns = [
-            "leadership", "communication", "teamwork", "problem-solving",
-            "analytical", "project management", "collaboration", "mentoring"
-        ]
-        for skill in soft_skill_patterns:
-            if skill in text_lower:
-                skills.soft.append(skill)
+        # Technical skills, tools and soft skills, indexed by field
+        buckets = (skills.technical, skills.tools, skills.soft)
+        for term, field in zip(cls._KW_TERMS, cls._KW_FIELDS):
+            if field != _KEYWORD_ONLY and term in found_terms:
+                buckets[field].append(term)
 
         return skills
 
-    def _extract_certifications(self, text: str, sections: Dict) -> List[str]:
+    @classmethod
+    def _extract_certifications(cls, text: str, sections: Dict) -> List[str]:
         """Extract certifications"""
-        certs = []
-        cert_patterns = [
-            r"(?i)(AWS|Azure|GCP|Google Cloud)[\w\s]+(?:Certified|Certification)",
-            r"(?i)(?:Certified|Certification)[\w\s]+",
-            r"(?i)PMP|CISSP|CCNA|CCNP|CompTIA[\w\s]+"
-        ]
-
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text)
-            certs.extend(matches)
-
-        return list(set(certs))[:10]
-
-    def _extract_projects(self, text: str, sections: Dict) -> List[Project]:
+        # Insertion-ordered dedup, stopping once the limit is reached
+        certs: Dict[str, None] = {}
+        for pattern in _CERT_RES:
+            for match in pattern.findall(text):
+                certs[match] = None
+                if len(certs) == 10:
+                    return list(certs)
+
+        return list(certs)
+
+    @classmethod
+    def _extract_projects(
+        cls,
+        text: str,
+        lines: List[str],
+        sections: Dict
+    ) -> List[Project]:
         """Extract projects"""
         projects = []
 
         # Look for project section
         if "projects" in sections:
             start = sections["projects"]
-            lines = text.split('\n')[start:start + 20]
 
             current_project = None
-            for line in lines:
+            for line in lines[start:start + 20]:
                 line = line.strip()
                 if not line:
                     continue
 
+                is_bullet = line[0] in _PROJECT_BULLET_CHARS
+
                 # New project (typically bold or titled)
-                if len(line) < 100 and not line.startswith(('•', '-', '*')):
+                if len(line) < 100 and not is_bullet:
                     if current_project:
                         projects.append(current_project)
                     current_project = Project(name=line, description="", tech=[])
-                elif current_project and line.startswith(('•', '-', '*')):
-                    desc = re.sub(r'^[•\-*]+\s*', '', line)
+                elif current_project and is_bullet:
+                    desc = line.lstrip(_PROJECT_BULLET_MARKERS).lstrip()
                     if current_project.description:
                         current_project.description += " " + desc
                     else:
@@ -386,17 +564,20 @@ class ResumeParserAgent(BaseAgent):
 
         return projects[:5]
 
-    def _extract_all_keywords(self, text: str) -> List[str]:
+    @classmethod
+    def _extract_all_keywords(
+        cls,
+        text: str,
+        found_terms: Optional[FrozenSet[str]] = None
+    ) -> List[str]:
         """Extract all relevant keywords from resume"""
-        keywords = set()
-        text_lower = text.lower()
+        if found_terms is None:
+            found_terms = cls._find_terms(text)
 
-        for category, terms in self.TECH_KEYWORDS.items():
-            for term in terms:
-                if term in text_lower:
-                    keywords.add(term)
-
-        return list(keywords)
+        return [
+            term for term, field in zip(cls._KW_TERMS, cls._KW_FIELDS)
+            if field != _SOFT and term in found_terms
+        ]
 
     def _extract_keywords(self, task: Dict[str, Any]) -> AgentOutput:
         """Extract keywords from text"""
@@ -423,3 +604,9 @@ class ResumeParserAgent(BaseAgent):
                 }
             }
         )
+
+
+def _parse_one(parser_class: type, text: str) -> Dict[str, Any]:
+    """Parse one resume text in a worker process"""
+    # Extraction only reads class attributes, so no agent is constructed
+    return parser_class._extract_resume_data(text).to_dict()
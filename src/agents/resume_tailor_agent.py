@@ -1,43 +1,142 @@
 """Resume Tailor Agent - Customizes resumes for specific jobs"""
 
+import heapq
+import json
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 
 from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
 from ..schemas import AgentOutput
+from ..utils.keywords import keyword_matcher
+
+
+# Technical terms looked for in job postings
+_TECH_TERMS = (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "Go", "Rust", "Ruby",
+    "PHP", "Swift", "Kotlin",
+    "React", "Angular", "Vue", "Django", "Flask", "FastAPI", "Spring", "Node.js",
+    "Express",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Jenkins", "Git",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "SQL",
+    "REST", "GraphQL", "API", "Microservices", "CI/CD", "DevOps", "Agile", "Scrum",
+    "Machine Learning", "Deep Learning", "AI", "Data Science", "Analytics"
+)
+
+# Experience and degree requirements
+_EXP_RE = re.compile(r"(\d+)\+?\s*(?:years?|yrs?)", re.IGNORECASE)
+_DEGREE_RE = re.compile(r"(?:Bachelor|Master|Ph\.?D|MBA)(?:'?s)?\s*(?:degree)?", re.IGNORECASE)
+
+# Quantified achievements in experience bullets
+_METRIC_RE = re.compile(r"\d+%|\$\d+|\d+\s*(?:users|customers|projects)")
+
+
+def _content_digest(content: Any) -> str:
+    """Stable hex digest of JSON-serializable content"""
+    encoded = json.dumps(content, sort_keys=True, default=str).encode("utf-8", "surrogatepass")
+    return blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ResumeContext(NamedTuple):
+    """Parsed resume and the fields derived from it, prepared once per user"""
+    parsed: Dict
+    personal: Dict
+    text_lower: str
+    digest: str
+    keyword_hits: Dict[str, bool]
+
+    @classmethod
+    def from_user(cls, user: Dict) -> "ResumeContext":
+        parsed = user.get("resume", {}).get("parsed") or {}
+        personal = user.get("personal", {})
+        return cls(
+            parsed=parsed,
+            personal=personal,
+            text_lower=str(parsed).lower(),
+            digest=_content_digest([parsed, personal]),
+            keyword_hits={}
+        )
+
+    def mentions(self, keyword: str) -> bool:
+        """Whether the resume text contains the keyword, scanning once per keyword"""
+        keyword = keyword.lower()
+        hit = self.keyword_hits.get(keyword)
+        if hit is None:
+            hit = self.keyword_hits[keyword] = keyword in self.text_lower
+        return hit
+
+
+@lru_cache(maxsize=2048)
+def _job_keywords(text: str) -> Tuple[str, ...]:
+    """Extract keywords from job text, reused when the same job comes up again"""
+    # Lowercased keyword -> first spelling seen, in order of appearance
+    keywords: Dict[str, str] = {}
+
+    # Technical terms, all categories in one pass
+    for term in keyword_matcher(_TECH_TERMS).findall(text):
+        keywords.setdefault(term.lower(), term)
+
+    # Years of experience
+    exp_match = _EXP_RE.search(text)
+    if exp_match:
+        keyword = f"{exp_match.group(1)}+ years experience"
+        keywords.setdefault(keyword, keyword)
+
+    # Degree requirements
+    for degree in _DEGREE_RE.findall(text):
+        keywords.setdefault(degree.lower(), degree)
+
+    return tuple(keywords.values())
 
 
 @AgentRegistry.register
 class ResumeTailorAgent(BaseAgent):
     """Agent responsible for tailoring resumes to specific job descriptions"""
 
-    @property
-    def name(self) -> str:
-        return "RESUME_TAILOR_AGENT"
+    # Batches smaller than PARALLEL_THRESHOLD are tailored inline. Larger ones
+    # overlap their job lookups on a thread pool; Database hands each thread
+    # its own connection.
+    PARALLEL_THRESHOLD = 4
+    MAX_WORKERS = 16
+
+    # Database cache namespace for tailored resumes; bump the version when the
+    # tailoring output changes and retire the old one so its rows are purged.
+    # Entries older than CACHE_TTL seconds are purged before each tailoring.
+    CACHE_NAMESPACE = "resume_tailor:v2"
+    RETIRED_CACHE_NAMESPACES = ("resume_tailor:v1",)
+    CACHE_TTL = 30 * 24 * 3600
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for namespace in self.RETIRED_CACHE_NAMESPACES:
+            self.database.purge_cache(namespace)
+        # Action name -> handler, looked up once per execute call
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], AgentOutput]] = {
+            "tailor_resume": self._tailor_resume,
+            "tailor_resumes": self._tailor_multiple_resumes,
+            "suggest_improvements": self._suggest_improvements,
+            "highlight_skills": self._highlight_skills
+        }
 
-    @property
-    def description(self) -> str:
-        return "Customizes resumes to match specific job requirements"
+    NAME = "RESUME_TAILOR_AGENT"
+    DESCRIPTION = "Customizes resumes to match specific job requirements"
 
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute resume tailoring tasks"""
         action = task.get("action", "")
 
-        if action == "tailor_resume":
-            return self._tailor_resume(task)
-        elif action == "tailor_resumes":
-            return self._tailor_multiple_resumes(task)
-        elif action == "suggest_improvements":
-            return self._suggest_improvements(task)
-        elif action == "highlight_skills":
-            return self._highlight_skills(task)
-        else:
+        handler = self._handlers.get(action)
+        if handler is None:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Unknown action: {action}"}
             )
+        return handler(task)
 
     def _tailor_resume(self, task: Dict[str, Any]) -> AgentOutput:
         """Tailor a resume for a specific job"""
@@ -50,10 +149,21 @@ class ResumeTailorAgent(BaseAgent):
                 output_data={"error": "user_id and job_id are required"}
             )
 
+        self.database.purge_cache(self.CACHE_NAMESPACE, self.CACHE_TTL)
         user = self.database.get_user(user_id)
+        ctx = ResumeContext.from_user(user) if user else None
+        return self._tailor_resume_prepared(user_id, job_id, ctx)
+
+    def _tailor_resume_prepared(
+        self,
+        user_id: str,
+        job_id: str,
+        ctx: Optional[ResumeContext]
+    ) -> AgentOutput:
+        """Tailor a resume for a job, given the user's already prepared resume"""
         job = self.database.get_job(job_id)
 
-        if not user:
+        if ctx is None:
             return self.create_output(
                 action="error",
                 output_data={"error": f"User not found: {user_id}"}
@@ -65,34 +175,34 @@ class ResumeTailorAgent(BaseAgent):
                 output_data={"error": f"Job not found: {job_id}"}
             )
 
-        resume = user.get("resume", {})
-        if not resume.get("parsed"):
+        if not ctx.parsed:
             return self.create_output(
                 action="error",
                 output_data={"error": "No parsed resume found for user"}
             )
 
-        # Analyze job requirements
-        job_keywords = self._extract_job_keywords(job)
-
-        # Tailor the resume
-        tailored = self._create_tailored_resume(
-            resume["parsed"],
-            job,
-            job_keywords,
-            user.get("personal", {})
-        )
-
-        # Generate suggestions
-        suggestions = self._generate_suggestions(resume["parsed"], job, job_keywords)
+        # Reuse an earlier tailoring of the same resume for the same job content
+        cache_key = ctx.digest + _content_digest([
+            job.get("title", ""),
+            job.get("company", ""),
+            job.get("description", ""),
+            job.get("requirements", [])
+        ])
+        tailoring = self.database.get_cached(self.CACHE_NAMESPACE, cache_key)
+        if tailoring is None:
+            tailoring = self._tailor_for_job(ctx, job)
+            self.database.save_cached(self.CACHE_NAMESPACE, cache_key, tailoring)
+
+        job_keywords = tailoring["job_keywords"]
+        tailored = tailoring["tailored_resume"]
 
         result = {
             "user_id": user_id,
             "job_id": job_id,
             "tailored_resume": tailored,
-            "suggestions": suggestions,
+            "suggestions": tailoring["suggestions"],
             "keywords_used": job_keywords[:15],
-            "tailoring_notes": self._get_tailoring_notes(resume["parsed"], job_keywords)
+            "tailoring_notes": tailoring["tailoring_notes"]
         }
 
         return self.create_output(
@@ -107,6 +217,26 @@ class ResumeTailorAgent(BaseAgent):
             }
         )
 
+    def _tailor_for_job(self, ctx: ResumeContext, job: Dict) -> Dict[str, Any]:
+        """Tailor the resume for a job and collect the suggestions and notes"""
+        # Analyze job requirements
+        job_keywords = self._extract_job_keywords(job)
+
+        # Tailor the resume
+        tailored = self._create_tailored_resume(
+            ctx.parsed,
+            job,
+            job_keywords,
+            ctx.personal
+        )
+
+        return {
+            "job_keywords": job_keywords,
+            "tailored_resume": tailored,
+            "suggestions": self._generate_suggestions(ctx, job, job_keywords),
+            "tailoring_notes": self._get_tailoring_notes(ctx, job_keywords)
+        }
+
     def _tailor_multiple_resumes(self, task: Dict[str, Any]) -> AgentOutput:
         """Tailor resumes for multiple jobs"""
         user_id = task.get("user_id")
@@ -124,24 +254,48 @@ class ResumeTailorAgent(BaseAgent):
                 output_data={"error": "job_ids are required"}
             )
 
-        results = []
-        for job_id in job_ids:
-            result = self._tailor_resume({
-                "user_id": user_id,
-                "job_id": job_id
-            })
-            results.append({
+        self.database.purge_cache(self.CACHE_NAMESPACE, self.CACHE_TTL)
+
+        # The user's resume is the same for every job, so prepare it once
+        user = self.database.get_user(user_id)
+        ctx = ResumeContext.from_user(user) if user else None
+
+        def _tailor_one(job_id: str) -> Dict[str, Any]:
+            if not job_id:
+                result = self.create_output(
+                    action="error",
+                    output_data={"error": "user_id and job_id are required"}
+                )
+            else:
+                result = self._tailor_resume_prepared(user_id, job_id, ctx)
+            return {
                 "job_id": job_id,
                 "success": "error" not in result.output_data,
                 "output": result.output_data
-            })
+            }
+
+        results = []
+        successful = 0
+
+        def _collect(entries: Iterable[Dict[str, Any]]) -> None:
+            nonlocal successful
+            for entry in entries:
+                results.append(entry)
+                successful += entry["success"]
+
+        if len(job_ids) < self.PARALLEL_THRESHOLD:
+            _collect(map(_tailor_one, job_ids))
+        else:
+            workers = min(self.MAX_WORKERS, len(job_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                _collect(executor.map(_tailor_one, job_ids))
 
         return self.create_output(
             action="resumes_tailored",
             output_data={
                 "user_id": user_id,
                 "total_jobs": len(job_ids),
-                "successful": sum(1 for r in results if r["success"]),
+                "successful": successful,
                 "results": results
             }
         )
@@ -160,10 +314,11 @@ class ResumeTailorAgent(BaseAgent):
                 output_data={"error": "User or job not found"}
             )
 
-        resume = user.get("resume", {}).get("parsed", {})
         job_keywords = self._extract_job_keywords(job)
 
-        suggestions = self._generate_suggestions(resume, job, job_keywords)
+        suggestions = self._generate_suggestions(
+            ResumeContext.from_user(user), job, job_keywords
+        )
 
         return self.create_output(
             action="improvements_suggested",
@@ -199,8 +354,16 @@ class ResumeTailorAgent(BaseAgent):
             user_skills.update(s.lower() for s in skills_data.get("tools", []))
         user_skills.update(s.lower() for s in resume.get("extracted_keywords", []))
 
-        matching = [s for s in user_skills if s in [k.lower() for k in job_keywords]]
-        missing = [k for k in job_keywords if k.lower() not in user_skills]
+        # One pass over the job keywords, which are already unique ignoring
+        # case, splits them by whether the user has the skill
+        matching = []
+        missing = []
+        for keyword in job_keywords:
+            keyword_lower = keyword.lower()
+            if keyword_lower in user_skills:
+                matching.append(keyword_lower)
+            else:
+                missing.append(keyword)
 
         return self.create_output(
             action="skills_highlighted",
@@ -219,32 +382,7 @@ class ResumeTailorAgent(BaseAgent):
             " ".join(job.get("requirements", []))
         )
 
-        keywords = set()
-
-        # Technical terms pattern
-        tech_patterns = [
-            r'\b(?:Python|JavaScript|TypeScript|Java|C\+\+|Go|Rust|Ruby|PHP|Swift|Kotlin)\b',
-            r'\b(?:React|Angular|Vue|Django|Flask|FastAPI|Spring|Node\.js|Express)\b',
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Terraform|Jenkins|Git)\b',
-            r'\b(?:PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|SQL)\b',
-            r'\b(?:REST|GraphQL|API|Microservices|CI/CD|DevOps|Agile|Scrum)\b',
-            r'\b(?:Machine Learning|Deep Learning|AI|Data Science|Analytics)\b'
-        ]
-
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            keywords.update(m for m in matches)
-
-        # Years of experience
-        exp_match = re.findall(r'(\d+)\+?\s*(?:years?|yrs?)', text, re.IGNORECASE)
-        if exp_match:
-            keywords.add(f"{exp_match[0]}+ years experience")
-
-        # Degree requirements
-        degree_match = re.findall(r"(?:Bachelor|Master|Ph\.?D|MBA)(?:'?s)?\s*(?:degree)?", text, re.IGNORECASE)
-        keywords.update(degree_match)
-
-        return list(keywords)
+        return list(_job_keywords(text))
 
     def _create_tailored_resume(
         self,
@@ -255,6 +393,7 @@ class ResumeTailorAgent(BaseAgent):
     ) -> str:
         """Create a tailored resume text"""
         lines = []
+        job_keywords_lower = [k.lower() for k in job_keywords]
 
         # Header
         name = personal.get("name", "")
@@ -262,55 +401,49 @@ class ResumeTailorAgent(BaseAgent):
         phone = personal.get("phone", "")
         linkedin = personal.get("linkedin", "")
 
-        lines.append(f"# {name}")
         contact_parts = [p for p in [email, phone, linkedin] if p]
-        lines.append(" | ".join(contact_parts))
-        lines.append("")
+        lines.extend((f"# {name}", " | ".join(contact_parts), ""))
 
         # Tailored Summary
         original_summary = parsed_resume.get("summary", "")
         tailored_summary = self._tailor_summary(original_summary, job, job_keywords)
-        lines.append("## Professional Summary")
-        lines.append(tailored_summary)
-        lines.append("")
+        lines.extend(("## Professional Summary", tailored_summary, ""))
 
         # Skills (prioritized by job relevance)
         skills = parsed_resume.get("skills", {})
         prioritized_skills = self._prioritize_skills(skills, job_keywords)
-        lines.append("## Technical Skills")
-        lines.append(", ".join(prioritized_skills[:20]))
-        lines.append("")
+        lines.extend(("## Technical Skills", ", ".join(prioritized_skills[:20]), ""))
 
         # Experience (with tailored bullets)
         lines.append("## Professional Experience")
         for exp in parsed_resume.get("experience", []):
             lines.append(f"### {exp.get('title', '')} at {exp.get('company', '')}")
             lines.append(f"*{exp.get('duration', '')}*")
-            tailored_bullets = self._tailor_bullets(exp.get("bullets", []), job_keywords)
-            for bullet in tailored_bullets:
-                lines.append(f"- {bullet}")
+            tailored_bullets = self._tailor_bullets(exp.get("bullets", []), job_keywords_lower)
+            lines.extend(f"- {bullet}" for bullet in tailored_bullets)
             lines.append("")
 
         # Education
         lines.append("## Education")
-        for edu in parsed_resume.get("education", []):
-            lines.append(f"**{edu.get('degree', '')}** - {edu.get('institution', '')} ({edu.get('year', '')})")
+        lines.extend(
+            f"**{edu.get('degree', '')}** - {edu.get('institution', '')} ({edu.get('year', '')})"
+            for edu in parsed_resume.get("education", [])
+        )
         lines.append("")
 
         # Certifications (if relevant)
         certs = parsed_resume.get("certifications", [])
         if certs:
             lines.append("## Certifications")
-            for cert in certs[:5]:
-                lines.append(f"- {cert}")
+            lines.extend(f"- {cert}" for cert in certs[:5])
             lines.append("")
 
         # Projects (if relevant to job)
         projects = parsed_resume.get("projects", [])
-        relevant_projects = self._filter_relevant_projects(projects, job_keywords)
+        relevant_projects = self._filter_relevant_projects(projects, job_keywords_lower, limit=3)
         if relevant_projects:
             lines.append("## Key Projects")
-            for proj in relevant_projects[:3]:
+            for proj in relevant_projects:
                 lines.append(f"### {proj.get('name', '')}")
                 lines.append(proj.get("description", ""))
                 if proj.get("tech"):
@@ -329,10 +462,8 @@ class ResumeTailorAgent(BaseAgent):
             summary = "Experienced professional"
 
         # Enhance with job-relevant keywords
-        keyword_additions = []
-        for keyword in keywords[:5]:
-            if keyword.lower() not in summary.lower():
-                keyword_additions.append(keyword)
+        summary_lower = summary.lower()
+        keyword_additions = [k for k in keywords[:5] if k.lower() not in summary_lower]
 
         if keyword_additions:
             summary += f" with expertise in {', '.join(keyword_additions[:3])}"
@@ -351,43 +482,49 @@ class ResumeTailorAgent(BaseAgent):
             all_skills.extend(skills.get("tools", []))
             all_skills.extend(skills.get("soft", []))
 
-        job_keywords_lower = [k.lower() for k in job_keywords]
+        job_keywords_lower = {k.lower() for k in job_keywords}
 
-        # Sort by relevance to job
-        prioritized = sorted(
-            all_skills,
-            key=lambda s: (
-                -1 if s.lower() in job_keywords_lower else 0,
-                s.lower()
-            )
-        )
+        # Skills the job asks for first, each group in alphabetical order
+        matched = []
+        rest = []
+        for skill in all_skills:
+            (matched if skill.lower() in job_keywords_lower else rest).append(skill)
+        matched.sort(key=str.lower)
+        rest.sort(key=str.lower)
 
-        return prioritized
+        return matched + rest
 
-    def _tailor_bullets(self, bullets: List[str], job_keywords: List[str]) -> List[str]:
-        """Tailor experience bullets for the job"""
+    def _tailor_bullets(self, bullets: List[str], job_keywords_lower: List[str]) -> List[str]:
+        """Tailor experience bullets for the job, given lowercased job keywords"""
         if not bullets:
             return []
 
-        job_keywords_lower = [k.lower() for k in job_keywords]
-
         # Score and sort bullets by relevance
         scored_bullets = []
         for bullet in bullets:
-            score = sum(1 for k in job_keywords_lower if k in bullet.lower())
+            bullet_lower = bullet.lower()
+            # Count the keywords present; a filtered list is cheaper than
+            # summing a generator of ones
+            score = len([k for k in job_keywords_lower if k in bullet_lower])
             scored_bullets.append((score, bullet))
 
-        scored_bullets.sort(key=lambda x: x[0], reverse=True)
-
-        # Return top bullets, ensuring at least some content
-        return [b for _, b in scored_bullets[:5]]
-
-    def _filter_relevant_projects(self, projects: List[Dict], job_keywords: List[str]) -> List[Dict]:
-        """Filter projects relevant to the job"""
-        job_keywords_lower = [k.lower() for k in job_keywords]
+        # Return top bullets, ensuring at least some content; nlargest keeps
+        # ties in their original order, like a stable descending sort
+        return [b for _, b in heapq.nlargest(5, scored_bullets, key=itemgetter(0))]
 
+    def _filter_relevant_projects(
+        self,
+        projects: List[Dict],
+        job_keywords_lower: List[str],
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Filter projects relevant to the job, given lowercased job keywords"""
         relevant = []
         for proj in projects:
+            # Stop once enough relevant projects have been found
+            if limit is not None and len(relevant) >= limit:
+                break
+
             text = (
                 proj.get("name", "") + " " +
                 proj.get("description", "") + " " +
@@ -399,13 +536,18 @@ class ResumeTailorAgent(BaseAgent):
 
         return relevant
 
-    def _generate_suggestions(self, resume: Dict, job: Dict, job_keywords: List[str]) -> List[Dict]:
+    def _generate_suggestions(
+        self,
+        ctx: ResumeContext,
+        job: Dict,
+        job_keywords: List[str]
+    ) -> List[Dict]:
         """Generate suggestions for improving resume match"""
         suggestions = []
+        resume = ctx.parsed
 
         # Check for missing keywords
-        resume_text = str(resume).lower()
-        missing_keywords = [k for k in job_keywords if k.lower() not in resume_text]
+        missing_keywords = [k for k in job_keywords if not ctx.mentions(k)]
 
         if missing_keywords:
             suggestions.append({
@@ -426,8 +568,8 @@ class ResumeTailorAgent(BaseAgent):
 
         # Check for quantified achievements
         has_numbers = any(
-            re.search(r'\d+%|\$\d+|\d+\s*(?:users|customers|projects)', str(exp))
-            for exp in experience
+            _METRIC_RE.search(bullet)
+            for exp in experience for bullet in exp.get("bullets", [])
         )
         if not has_numbers:
             suggestions.append({
@@ -447,12 +589,11 @@ class ResumeTailorAgent(BaseAgent):
 
         return suggestions
 
-    def _get_tailoring_notes(self, resume: Dict, job_keywords: List[str]) -> List[str]:
+    def _get_tailoring_notes(self, ctx: ResumeContext, job_keywords: List[str]) -> List[str]:
         """Get notes about what was tailored"""
         notes = []
 
-        resume_text = str(resume).lower()
-        matched = [k for k in job_keywords if k.lower() in resume_text]
+        matched = [k for k in job_keywords if ctx.mentions(k)]
 
         if matched:
             notes.append(f"Emphasized {len(matched)} matching skills/keywords")
@@ -2,26 +2,56 @@
 
 import re
 import hashlib
-from typing import Any, Dict, List, Optional
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
 
 from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
 from ..schemas import AgentOutput, Job, JobStatus, RemoteStatus, SalaryRange
+from ..utils.dedup import content_hash, lsh_band_keys, minhash_signature
+
+
+# Markup tags, replaced with spaces when converting HTML to text
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Job listing fields
+_TITLE_RE = re.compile(r'(?i)(job title|position|role)[:\s]*([^\n]+)')
+_LOCATION_RE = re.compile(r'(?i)(location|based in)[:\s]*([^\n]+)')
+# Salary range, capturing its lower and optional upper bound
+_SALARY_RE = re.compile(r'\$([\d,]+)(?:\s*-\s*\$([\d,]+))?')
+
+# Remote status, matched against lowercased content; fully remote wins
+_REMOTE_RE = re.compile(r'fully?\s*remote|100%?\s*remote|remote\s*only')
+_HYBRID_RE = re.compile(r'hybrid|flexible|some remote')
+
+# Requirements section and its bullet points
+_REQUIREMENTS_RE = re.compile(
+    r'(?i)(requirements?|qualifications?|what you.ll need)[:\s]*([^#]+?)(?=\n\n|\Z)'
+)
+_REQUIREMENT_BULLET_RE = re.compile(r'[•\-*]\s*([^\n•\-*]+)')
 
 
 @AgentRegistry.register
 class ScraperAgent(BaseAgent):
     """Agent responsible for scraping job listings from various sources"""
 
-    @property
-    def name(self) -> str:
-        return "SCRAPER_AGENT"
+    NAME = "SCRAPER_AGENT"
+    DESCRIPTION = "Fetches and parses job listings from career pages"
+
+    # Sources are scraped on a thread pool once there are PARALLEL_THRESHOLD
+    # of them, so their fetches overlap; Database hands each thread its own
+    # connection
+    PARALLEL_THRESHOLD = 2
+    MAX_WORKERS = 20
 
-    @property
-    def description(self) -> str:
-        return "Fetches and parses job listings from career pages"
+    # Worker threads shared by all scrapers for background scrape jobs
+    BACKGROUND_WORKERS = 4
+    _background: Optional[ThreadPoolExecutor] = None
+    _background_lock = threading.Lock()
 
     # Common job board patterns
     JOB_BOARD_PATTERNS = {
@@ -40,6 +70,19 @@ class ScraperAgent(BaseAgent):
             "pattern": r"ashbyhq\.com"
         }
     }
+    # Cache namespace mapping content hashes and MinHash band keys to the
+    # job saved under them, scoped per company. Keys older than DEDUP_TTL
+    # seconds are purged, so a listing reposted after that long is new again.
+    DEDUP_NAMESPACE = "scraper:job_minhash"
+    DEDUP_TTL = 90 * 24 * 3600
+    # Scrapes run on worker threads; the duplicate check and the save that
+    # records a job's keys must not interleave
+    _dedup_lock = threading.Lock()
+
+    _BOARD_RES = tuple(
+        (board_name, re.compile(config["pattern"]))
+        for board_name, config in JOB_BOARD_PATTERNS.items()
+    )
 
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute scraping tasks"""
@@ -51,6 +94,8 @@ class ScraperAgent(BaseAgent):
             return self._scrape_company(task)
         elif action == "scrape_new_jobs":
             return self._scrape_new_jobs(task)
+        elif action == "get_scrape_result":
+            return self._get_scrape_result(task)
         elif action == "parse_job_listing":
             return self._parse_job_listing(task)
         elif action == "add_source":
@@ -70,15 +115,21 @@ class ScraperAgent(BaseAgent):
                 output_data={"error": "URL is required"}
             )
 
+        # Queue the scrape and return at once; callers poll get_scrape_result
+        if task.get("background"):
+            return self._submit_scrape(task)
+
         # Detect job board type
         board_type = self._detect_board_type(url)
 
-        # Fetch and parse jobs
-        jobs = self._fetch_jobs(url, board_type)
-
-        # Save jobs to database
-        saved_count = 0
-        for job_data in jobs:
+        # Stream jobs from the source and save them as they are parsed,
+        # skipping reposts of jobs already stored
+        self.database.purge_cache(self.DEDUP_NAMESPACE, self.DEDUP_TTL)
+        jobs_found = 0
+        job_ids = []
+        duplicates = {}
+        for job_data in self._fetch_jobs(url, board_type):
+            jobs_found += 1
             job_id = Job.generate_job_id(
                 job_data["company"],
                 job_data["title"],
@@ -89,25 +140,156 @@ class ScraperAgent(BaseAgent):
             job_data["scraped_at"] = datetime.now().isoformat()
             job_data["status"] = JobStatus.NEW.value
 
-            self.database.save_job(job_id, job_data)
-            saved_count += 1
+            dedup_keys = self._dedup_keys(job_data)
+            with self._dedup_lock:
+                duplicate_of = self._find_duplicate_job(job_id, dedup_keys)
+                if not duplicate_of:
+                    self.database.save_job(job_id, job_data)
+                    self.database.save_cached_many(
+                        self.DEDUP_NAMESPACE, dict.fromkeys(dedup_keys, job_id)
+                    )
+            if duplicate_of:
+                duplicates[job_id] = duplicate_of
+                continue
+            job_ids.append(job_id)
 
         return self.create_output(
             action="jobs_scraped",
             output_data={
                 "url": url,
                 "board_type": board_type or "unknown",
-                "jobs_found": len(jobs),
-                "jobs_saved": saved_count,
-                "job_ids": [j.get("job_id") for j in jobs]
+                "jobs_found": jobs_found,
+                "jobs_saved": len(job_ids),
+                "job_ids": job_ids,
+                "duplicates": duplicates
             },
             next_agent="MATCHER_AGENT" if task.get("auto_match") else None,
             pass_data={
-                "job_ids": [j.get("job_id") for j in jobs],
+                "job_ids": job_ids,
                 "user_id": task.get("user_id")
             } if task.get("auto_match") else None
         )
 
+    def _dedup_keys(self, job_data: Dict) -> List[str]:
+        """Content hash and LSH band keys of a listing, scoped to its company"""
+        text = " ".join([
+            job_data.get("title", ""),
+            job_data.get("description", ""),
+            " ".join(job_data.get("requirements", []))
+        ])
+        signature = minhash_signature(text)
+        if not signature:
+            return []
+        company = job_data.get("company", "").lower()
+        keys = [f"{company}:exact:{content_hash(text)}"]
+        keys.extend(f"{company}:lsh:{key}" for key in lsh_band_keys(signature))
+        return keys
+
+    def _find_duplicate_job(self, job_id: str, dedup_keys: List[str]) -> Optional[str]:
+        """Return the id of a different stored job with the same or near-same content"""
+        if not dedup_keys:
+            return None
+        # Exact content match first; it is one indexed lookup. Keys can
+        # outlive the job they point to, so a hit only counts if it exists.
+        exact = self.database.get_cached(self.DEDUP_NAMESPACE, dedup_keys[0])
+        if exact:
+            if exact == job_id:
+                return None
+            if self.database.get_job(exact):
+                return exact
+
+        candidates = [
+            existing_id
+            for existing_id in dict.fromkeys(self.database.get_cached_many(
+                self.DEDUP_NAMESPACE, dedup_keys[1:]
+            ).values())
+            if existing_id != job_id
+        ]
+        if candidates:
+            existing = self.database.get_jobs_by_ids(candidates)
+            for existing_id in candidates:
+                if existing_id in existing:
+                    return existing_id
+        return None
+
+    def _submit_scrape(self, task: Dict[str, Any]) -> AgentOutput:
+        """Queue a URL scrape on the background workers"""
+        scrape_id = uuid.uuid4().hex[:16]
+        url = task["url"]
+        self.database.save_scrape_job(scrape_id, {"url": url, "status": "queued"})
+
+        self._background_executor().submit(
+            self._run_scrape, scrape_id, {**task, "background": False}
+        )
+
+        return self.create_output(
+            action="scrape_queued",
+            output_data={"scrape_id": scrape_id, "url": url, "status": "queued"}
+        )
+
+    def _run_scrape(self, scrape_id: str, task: Dict[str, Any]) -> None:
+        """Run a queued scrape and record its outcome"""
+        url = task["url"]
+        self.database.save_scrape_job(scrape_id, {"url": url, "status": "running"})
+        try:
+            result = self._scrape_url(task)
+        except Exception as e:
+            self.logger.error(f"Background scrape {scrape_id} failed: {e}")
+            self.database.save_scrape_job(scrape_id, {
+                "url": url,
+                "status": "failed",
+                "error": str(e)
+            })
+            return
+
+        self.database.save_scrape_job(scrape_id, {
+            "url": url,
+            "status": "completed",
+            "result": result.output_data,
+            "next_agent": result.next_agent,
+            "pass_data": result.pass_data
+        })
+
+    @classmethod
+    def _background_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared background executor, starting it on first use"""
+        with cls._background_lock:
+            if cls._background is None:
+                cls._background = ThreadPoolExecutor(
+                    max_workers=cls.BACKGROUND_WORKERS,
+                    thread_name_prefix="scraper"
+                )
+            return cls._background
+
+    def _get_scrape_result(self, task: Dict[str, Any]) -> AgentOutput:
+        """Get the status, and once finished the result, of a background scrape"""
+        scrape_id = task.get("scrape_id", "")
+        scrape = self.database.get_scrape_job(scrape_id) if scrape_id else None
+
+        if not scrape:
+            return self.create_output(
+                action="error",
+                output_data={"error": f"Scrape not found: {scrape_id}"}
+            )
+
+        output_data = {
+            "scrape_id": scrape_id,
+            "url": scrape.get("url"),
+            "status": scrape["status"]
+        }
+        if "result" in scrape:
+            output_data["result"] = scrape["result"]
+        if "error" in scrape:
+            output_data["error"] = scrape["error"]
+
+        # A completed scrape hands off to the matcher as a direct scrape would
+        return self.create_output(
+            action="scrape_result",
+            output_data=output_data,
+            next_agent=scrape.get("next_agent"),
+            pass_data=scrape.get("pass_data")
+        )
+
     def _scrape_company(self, task: Dict[str, Any]) -> AgentOutput:
         """Scrape jobs from a company's career page"""
         company = task.get("company", "")
@@ -142,19 +324,29 @@ class ScraperAgent(BaseAgent):
             # Use default sources if none configured
             sources = self._get_default_sources()
 
-        all_jobs = []
-        errors = []
-
-        for source in sources:
+        def _scrape_source(source: Dict) -> Tuple[List[str], Optional[Dict]]:
             try:
                 result = self._scrape_url({
                     "url": source.get("url"),
                     "user_id": task.get("user_id")
                 })
-                if result.output_data.get("job_ids"):
-                    all_jobs.extend(result.output_data["job_ids"])
             except Exception as e:
-                errors.append({"source": source.get("url"), "error": str(e)})
+                return [], {"source": source.get("url"), "error": str(e)}
+            return result.output_data.get("job_ids") or [], None
+
+        if len(sources) < self.PARALLEL_THRESHOLD:
+            outcomes = [_scrape_source(source) for source in sources]
+        else:
+            workers = min(self.MAX_WORKERS, len(sources))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_scrape_source, sources))
+
+        all_jobs = []
+        errors = []
+        for job_ids, error in outcomes:
+            all_jobs.extend(job_ids)
+            if error:
+                errors.append(error)
 
         return self.create_output(
             action="batch_scrape_complete",
@@ -217,33 +409,28 @@ class ScraperAgent(BaseAgent):
 
     def _detect_board_type(self, url: str) -> Optional[str]:
         """Detect the job board type from URL"""
-        for board_name, config in self.JOB_BOARD_PATTERNS.items():
-            if re.search(config["pattern"], url):
+        for board_name, pattern in self._BOARD_RES:
+            if pattern.search(url):
                 return board_name
         return None
 
-    def _fetch_jobs(self, url: str, board_type: Optional[str] = None) -> List[Dict]:
-        """Fetch jobs from URL (placeholder for actual implementation)"""
+    def _fetch_jobs(self, url: str, board_type: Optional[str] = None) -> Iterator[Dict]:
+        """Fetch jobs from URL, yielding each as it is parsed (placeholder)"""
         # In production, this would use requests/aiohttp to fetch
         # and BeautifulSoup/lxml to parse
 
-        # Return placeholder data structure
-        jobs = []
-
         # Simulate job extraction based on board type
         if board_type == "greenhouse":
-            jobs = self._parse_greenhouse(url)
+            yield from self._parse_greenhouse(url)
         elif board_type == "lever":
-            jobs = self._parse_lever(url)
+            yield from self._parse_lever(url)
         else:
-            jobs = self._parse_generic(url)
-
-        return jobs
+            yield from self._parse_generic(url)
 
-    def _parse_greenhouse(self, url: str) -> List[Dict]:
+    def _parse_greenhouse(self, url: str) -> Iterator[Dict]:
         """Parse Greenhouse job board (placeholder)"""
         # In production: fetch from Greenhouse API
-        return [{
+        yield {
             "title": "Software Engineer",
             "company": self._extract_company_from_url(url),
             "location": "San Francisco, CA",
@@ -251,12 +438,12 @@ class ScraperAgent(BaseAgent):
             "description": "Join our team...",
             "requirements": ["Python", "SQL", "3+ years experience"],
             "application_url": url
-        }]
+        }
 
-    def _parse_lever(self, url: str) -> List[Dict]:
+    def _parse_lever(self, url: str) -> Iterator[Dict]:
         """Parse Lever job board (placeholder)"""
         # In production: fetch from Lever API
-        return [{
+        yield {
             "title": "Senior Developer",
             "company": self._extract_company_from_url(url),
             "location": "Remote",
@@ -264,17 +451,17 @@ class ScraperAgent(BaseAgent):
             "description": "We're looking for...",
             "requirements": ["JavaScript", "React", "5+ years experience"],
             "application_url": url
-        }]
+        }
 
-    def _parse_generic(self, url: str) -> List[Dict]:
+    def _parse_generic(self, url: str) -> Iterator[Dict]:
         """Parse generic career page (placeholder)"""
-        return [{
+        yield {
             "title": "Developer",
             "company": self._extract_company_from_url(url),
             "location": "Various",
             "description": "Open position...",
             "application_url": url
-        }]
+        }
 
     def _extract_company_from_url(self, url: str) -> str:
         """Extract company name from URL"""
@@ -312,23 +499,23 @@ class ScraperAgent(BaseAgent):
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text (placeholder)"""
         # In production: use BeautifulSoup
-        text = re.sub(r'<[^>]+>', ' ', html)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # str.split collapses and trims whitespace runs in C, in place of a
+        # second regex pass
+        return " ".join(_TAG_RE.sub(' ', html).split())
 
     def _parse_job_content(self, content: str, url: str) -> Dict:
         """Parse job content into structured format"""
         # Extract title
-        title_match = re.search(r'(?i)(job title|position|role)[:\s]*([^\n]+)', content)
+        title_match = _TITLE_RE.search(content)
         title = title_match.group(2).strip() if title_match else "Unknown Position"
 
         # Extract location
-        location_match = re.search(r'(?i)(location|based in)[:\s]*([^\n]+)', content)
+        location_match = _LOCATION_RE.search(content)
         location = location_match.group(2).strip() if location_match else ""
 
         # Extract salary
-        salary_match = re.search(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?', content)
-        salary_range = self._parse_salary(salary_match.group(0)) if salary_match else {}
+        salary_match = _SALARY_RE.search(content)
+        salary_range = self._parse_salary(*salary_match.groups()) if salary_match else {}
 
         # Extract remote status
         remote_status = self._detect_remote_status(content)
@@ -346,25 +533,20 @@ class ScraperAgent(BaseAgent):
             "application_url": url
         }
 
-    def _parse_salary(self, salary_str: str) -> Dict:
-        """Parse salary string into min/max"""
-        numbers = re.findall(r'[\d,]+', salary_str)
-        if len(numbers) >= 2:
-            return {
-                "min": int(numbers[0].replace(",", "")),
-                "max": int(numbers[1].replace(",", ""))
-            }
-        elif len(numbers) == 1:
-            return {"min": int(numbers[0].replace(",", "")), "max": None}
-        return {}
+    def _parse_salary(self, low: str, high: Optional[str] = None) -> Dict:
+        """Parse captured salary bounds into min/max"""
+        return {
+            "min": int(low.replace(",", "")),
+            "max": int(high.replace(",", "")) if high else None
+        }
 
     def _detect_remote_status(self, content: str) -> str:
         """Detect remote work status from content"""
         content_lower = content.lower()
 
-        if re.search(r'fully?\s*remote|100%?\s*remote|remote\s*only', content_lower):
+        if _REMOTE_RE.search(content_lower):
             return RemoteStatus.REMOTE.value
-        elif re.search(r'hybrid|flexible|some remote', content_lower):
+        elif _HYBRID_RE.search(content_lower):
             return RemoteStatus.HYBRID.value
         else:
             return RemoteStatus.ONSITE.value
@@ -374,15 +556,12 @@ class ScraperAgent(BaseAgent):
         requirements = []
 
         # Look for requirements section
-        req_match = re.search(
-            r'(?i)(requirements?|qualifications?|what you.ll need)[:\s]*([^#]+?)(?=\n\n|\Z)',
-            content
-        )
+        req_match = _REQUIREMENTS_RE.search(content)
 
         if req_match:
             req_text = req_match.group(2)
             # Extract bullet points
-            bullets = re.findall(r'[•\-*]\s*([^\n•\-*]+)', req_text)
+            bullets = _REQUIREMENT_BULLET_RE.findall(req_text)
             requirements.extend([b.strip() for b in bullets if b.strip()])
 
         return requirements[:15]  # Limit to 15 requirements
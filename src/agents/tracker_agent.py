@@ -1,25 +1,47 @@
 """Tracker Agent - Tracks application status"""
 
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
-import uuid
+from functools import lru_cache
+import time
 
 from ..core.base_agent import BaseAgent
 from ..core.registry import AgentRegistry
 from ..schemas import AgentOutput, ApplicationStatus, TimelineEntry
+from ..utils.ids import new_ulid
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(date_str: str) -> Optional[datetime]:
+    """Parse an ISO timestamp once; the same submitted_at recurs across calls"""
+    try:
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1] + '+00:00'
+        return datetime.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return None
 
 
 @AgentRegistry.register
 class TrackerAgent(BaseAgent):
     """Agent responsible for tracking application status and history"""
 
-    @property
-    def name(self) -> str:
-        return "TRACKER_AGENT"
+    NAME = "TRACKER_AGENT"
+    DESCRIPTION = "Tracks application status and maintains application history"
 
-    @property
-    def description(self) -> str:
-        return "Tracks application status and maintains application history"
+    # Jobs looked up while enriching applications are kept in a bounded LRU.
+    # It is dropped after JOB_CACHE_TTL seconds, or as soon as any job is
+    # written through the shared database. Only the fields the tracker
+    # reports are kept, and each lookup gets its own copy of them.
+    JOB_CACHE_SIZE = 2048
+    JOB_CACHE_TTL = 60.0
+    JOB_CACHE_FIELDS = ("title", "company")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._job_cache: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._job_cache_state = (self.database.job_writes, time.monotonic())
 
     def execute(self, task: Dict[str, Any]) -> AgentOutput:
         """Execute tracking tasks"""
@@ -72,29 +94,14 @@ class TrackerAgent(BaseAgent):
             )
 
         # Create new application
-        app_id = str(uuid.uuid4())[:12]
-        now = datetime.now().isoformat()
-
-        application = {
-            "app_id": app_id,
-            "user_id": user_id,
-            "job_id": job_id,
-            "status": ApplicationStatus.PREPARING.value,
-            "match_score": task.get("match_score", 0),
-            "tailored_resume": application_data.get("tailored_resume", ""),
-            "cover_letter": application_data.get("cover_letter", ""),
-            "form_answers": application_data.get("form_answers", {}),
-            "submitted_at": None,
-            "created_at": now,
-            "updated_at": now,
-            "timeline": [{
-                "status": ApplicationStatus.PREPARING.value,
-                "date": now,
-                "note": "Application created"
-            }]
-        }
+        application = self._new_application(
+            user_id, job_id, application_data, task.get("match_score", 0)
+        )
+        app_id = application["app_id"]
 
-        self.database.save_application(app_id, application)
+        self.database.save_applications_bulk(
+            [application], timeline=[(app_id, application["timeline"][0])]
+        )
 
         return self.create_output(
             action="application_created",
@@ -130,34 +137,29 @@ class TrackerAgent(BaseAgent):
                 output_data={"error": f"Invalid status: {new_status}"}
             )
 
-        application = self.database.get_application(app_id)
-        if not application:
+        state = self.database.get_application_state(app_id)
+        if not state:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Application not found: {app_id}"}
             )
 
-        old_status = application.get("status")
+        old_status = state["status"]
         now = datetime.now().isoformat()
 
         # Update status
-        application["status"] = new_status
-        application["updated_at"] = now
+        fields = {"status": new_status, "updated_at": now}
+
+        # Set submitted_at if newly submitted
+        if new_status == ApplicationStatus.SUBMITTED.value and not state["submitted_at"]:
+            fields["submitted_at"] = now
 
-        # Add to timeline
-        timeline = application.get("timeline", [])
-        timeline.append({
+        # Update in place and append to the timeline
+        self.database.update_application(app_id, fields, timeline_entry={
             "status": new_status,
             "date": now,
             "note": note or f"Status changed from {old_status} to {new_status}"
         })
-        application["timeline"] = timeline
-
-        # Set submitted_at if newly submitted
-        if new_status == ApplicationStatus.SUBMITTED.value and not application.get("submitted_at"):
-            application["submitted_at"] = now
-
-        self.database.save_application(app_id, application)
 
         return self.create_output(
             action="status_updated",
@@ -179,7 +181,7 @@ class TrackerAgent(BaseAgent):
                 output_data={"error": "app_id is required"}
             )
 
-        application = self.database.get_application(app_id)
+        application = self.database.get_application(app_id, with_timeline=False)
         if not application:
             return self.create_output(
                 action="error",
@@ -187,7 +189,7 @@ class TrackerAgent(BaseAgent):
             )
 
         # Get job details
-        job = self.database.get_job(application.get("job_id", ""))
+        job = self._get_cached_job(application.get("job_id", ""))
 
         return self.create_output(
             action="status_retrieved",
@@ -217,12 +219,16 @@ class TrackerAgent(BaseAgent):
                 output_data={"error": "user_id is required"}
             )
 
-        applications = self.database.get_user_applications(user_id, status_filter)
+        applications = self.database.get_user_applications(
+            user_id, status_filter, with_timeline=False
+        )
 
-        # Enrich with job details
+        # Enrich with job details, fetched in one batch
+        page = applications[:limit]
+        jobs = self._get_cached_jobs(app.get("job_id", "") for app in page)
         enriched = []
-        for app in applications[:limit]:
-            job = self.database.get_job(app.get("job_id", ""))
+        for app in page:
+            job = jobs[app.get("job_id", "")]
             enriched.append({
                 "app_id": app.get("app_id"),
                 "job_id": app.get("job_id"),
@@ -263,26 +269,33 @@ class TrackerAgent(BaseAgent):
 
         created = []
         updated = []
+        to_create: List[Dict[str, Any]] = []
+        # Applications written by this batch, keyed by job id so repeated
+        # job ids see earlier changes and each row is flushed once
+        batch: Dict[str, Dict[str, Any]] = {}
+        now = datetime.now().isoformat()
 
         for job_id in job_ids:
-            existing = self._find_existing_application(user_id, job_id)
+            existing = batch.get(job_id) or self._find_existing_application(user_id, job_id)
 
             if existing:
                 # Update existing application
                 if application_data:
                     existing.update(application_data)
-                    existing["updated_at"] = datetime.now().isoformat()
-                    self.database.save_application(existing["app_id"], existing)
+                    existing["updated_at"] = now
+                    batch[job_id] = existing
                     updated.append(existing["app_id"])
             else:
                 # Create new application
-                result = self._create_application({
-                    "user_id": user_id,
-                    "job_id": job_id,
-                    "application_data": application_data or {}
-                })
-                if result.output_data.get("app_id"):
-                    created.append(result.output_data["app_id"])
+                application = self._new_application(user_id, job_id, application_data or {})
+                batch[job_id] = application
+                to_create.append(application)
+                created.append(application["app_id"])
+
+        self.database.save_applications_bulk(
+            list(batch.values()),
+            timeline=[(app["app_id"], app["timeline"][0]) for app in to_create]
+        )
 
         return self.create_output(
             action="tracking_updated",
@@ -297,7 +310,10 @@ class TrackerAgent(BaseAgent):
             pass_data={
                 "user_id": user_id,
                 "new_applications": created
-            }
+            },
+            save_to_memory={
+                f"applications.{app['app_id']}": app for app in to_create
+            } or None
         )
 
     def _refresh_status(self, task: Dict[str, Any]) -> AgentOutput:
@@ -311,18 +327,15 @@ class TrackerAgent(BaseAgent):
             )
 
         # Get all non-terminal applications
-        all_apps = self.database.get_user_applications(user_id)
         pending_statuses = [
             ApplicationStatus.PREPARING.value,
             ApplicationStatus.READY.value,
             ApplicationStatus.SUBMITTED.value,
             ApplicationStatus.INTERVIEW.value
         ]
-
-        pending_apps = [
-            app for app in all_apps
-            if app.get("status") in pending_statuses
-        ]
+        pending_apps = self.database.get_user_applications(
+            user_id, status_in=pending_statuses, with_timeline=False
+        )
 
         refreshed = []
         stale = []
@@ -359,21 +372,21 @@ class TrackerAgent(BaseAgent):
                 output_data={"error": "app_id is required"}
             )
 
-        application = self.database.get_application(app_id)
-        if not application:
+        state = self.database.get_application_state(app_id)
+        if not state:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Application not found: {app_id}"}
             )
 
-        timeline = application.get("timeline", [])
+        timeline = self.database.get_timeline(app_id)
 
         return self.create_output(
             action="timeline_retrieved",
             output_data={
                 "app_id": app_id,
                 "timeline": timeline,
-                "current_status": application.get("status"),
+                "current_status": state["status"],
                 "total_events": len(timeline)
             }
         )
@@ -389,8 +402,8 @@ class TrackerAgent(BaseAgent):
                 output_data={"error": "app_id and note are required"}
             )
 
-        application = self.database.get_application(app_id)
-        if not application:
+        state = self.database.get_application_state(app_id)
+        if not state:
             return self.create_output(
                 action="error",
                 output_data={"error": f"Application not found: {app_id}"}
@@ -399,16 +412,11 @@ class TrackerAgent(BaseAgent):
         now = datetime.now().isoformat()
 
         # Add note to timeline
-        timeline = application.get("timeline", [])
-        timeline.append({
-            "status": application.get("status"),
+        self.database.update_application(app_id, {"updated_at": now}, timeline_entry={
+            "status": state["status"],
             "date": now,
             "note": note
         })
-        application["timeline"] = timeline
-        application["updated_at"] = now
-
-        self.database.save_application(app_id, application)
 
         return self.create_output(
             action="note_added",
@@ -419,26 +427,88 @@ class TrackerAgent(BaseAgent):
             }
         )
 
+    def _get_cached_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job's cached fields through the LRU"""
+        return self._get_cached_jobs([job_id])[job_id]
+
+    def _get_cached_jobs(self, job_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get jobs' cached fields through the LRU, fetching all misses in one query"""
+        writes, started = self._job_cache_state
+        now = time.monotonic()
+        if writes != self.database.job_writes or now - started > self.JOB_CACHE_TTL:
+            self._job_cache.clear()
+            self._job_cache_state = (self.database.job_writes, now)
+
+        cache = self._job_cache
+        jobs = {}
+        missing = []
+        for job_id in dict.fromkeys(job_ids):
+            if job_id in cache:
+                cache.move_to_end(job_id)
+                jobs[job_id] = cache[job_id]
+            else:
+                missing.append(job_id)
+
+        if missing:
+            fetched = self.database.get_jobs_by_ids(missing)
+            for job_id in missing:
+                job = fetched.get(job_id)
+                jobs[job_id] = cache[job_id] = (
+                    {field: job[field] for field in self.JOB_CACHE_FIELDS if field in job}
+                    if job is not None else None
+                )
+            while len(cache) > self.JOB_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        # Copies, so callers can never modify a cached entry
+        return {
+            job_id: dict(job) if job is not None else None
+            for job_id, job in jobs.items()
+        }
+
+    def _new_application(
+        self,
+        user_id: str,
+        job_id: str,
+        application_data: Dict[str, Any],
+        match_score: float = 0
+    ) -> Dict[str, Any]:
+        """Build a fresh application record in the preparing state"""
+        now = datetime.now().isoformat()
+        return {
+            "app_id": new_ulid(),
+            "user_id": user_id,
+            "job_id": job_id,
+            "status": ApplicationStatus.PREPARING.value,
+            "match_score": match_score,
+            "tailored_resume": application_data.get("tailored_resume", ""),
+            "cover_letter": application_data.get("cover_letter", ""),
+            "form_answers": application_data.get("form_answers", {}),
+            "submitted_at": None,
+            "created_at": now,
+            "updated_at": now,
+            "timeline": [{
+                "status": ApplicationStatus.PREPARING.value,
+                "date": now,
+                "note": "Application created"
+            }]
+        }
+
     def _find_existing_application(
         self,
         user_id: str,
         job_id: str
     ) -> Optional[Dict]:
         """Find existing application for user and job"""
-        applications = self.database.get_user_applications(user_id)
-        for app in applications:
-            if app.get("job_id") == job_id:
-                return app
-        return None
+        return self.database.get_application_by_user_job(user_id, job_id)
 
     def _calculate_days_since(self, date_str: Optional[str]) -> Optional[int]:
         """Calculate days since a date"""
         if not date_str:
             return None
 
-        try:
-            date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            now = datetime.now(date.tzinfo) if date.tzinfo else datetime.now()
-            return (now - date).days
-        except (ValueError, TypeError):
+        date = _parse_timestamp(date_str)
+        if date is None:
             return None
+        now = datetime.now(date.tzinfo) if date.tzinfo else datetime.now()
+        return (now - date).days
@@ -4,37 +4,19 @@
 import argparse
 import json
 import sys
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .core.orchestrator import Orchestrator
 from .utils.memory import SharedMemory
-from .utils.database import Database
-
-# Import agents to register them
-from .agents import (
-    ProfileAgent,
-    ResumeParserAgent,
-    ScraperAgent,
-    MatcherAgent,
-    ResumeTailorAgent,
-    CoverLetterAgent,
-    FormFillerAgent,
-    QAAgent,
-    TrackerAgent,
-    DigestAgent,
-)
-
-
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser"""
-    parser = argparse.ArgumentParser(
-        prog="jobcopilot",
-        description="JobCopilot - Multi-Agent Job Application Automation System"
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+from .utils.database import Database, _dumps as _dumps_payload
+
+
+def _dumps(data: Any) -> str:
+    """Format command output as indented JSON"""
+    return _dumps_payload(data, indent=True)
 
-    # Profile commands
-    profile_parser = subparsers.add_parser("profile", help="Manage user profile")
+
+def _build_profile(profile_parser: argparse.ArgumentParser) -> None:
     profile_subparsers = profile_parser.add_subparsers(dest="profile_action")
 
     profile_create = profile_subparsers.add_parser("create", help="Create a new profile")
@@ -55,8 +37,8 @@ def create_parser() -> argparse.ArgumentParser:
     profile_update.add_argument("--phone", help="Phone number")
     profile_update.add_argument("--location", help="Current location")
 
-    # Job preferences commands
-    prefs_parser = subparsers.add_parser("preferences", help="Manage job preferences")
+
+def _build_preferences(prefs_parser: argparse.ArgumentParser) -> None:
     prefs_subparsers = prefs_parser.add_subparsers(dest="prefs_action")
 
     prefs_set = prefs_subparsers.add_parser("set", help="Set job preferences")
@@ -67,8 +49,8 @@ def create_parser() -> argparse.ArgumentParser:
     prefs_set.add_argument("--salary-min", type=int, help="Minimum salary")
     prefs_set.add_argument("--salary-max", type=int, help="Maximum salary")
 
-    # Scraper commands
-    scrape_parser = subparsers.add_parser("scrape", help="Scrape jobs")
+
+def _build_scrape(scrape_parser: argparse.ArgumentParser) -> None:
     scrape_subparsers = scrape_parser.add_subparsers(dest="scrape_action")
 
     scrape_url = scrape_subparsers.add_parser("url", help="Scrape from URL")
@@ -79,18 +61,18 @@ def create_parser() -> argparse.ArgumentParser:
     scrape_company.add_argument("--company", required=True, help="Company name")
     scrape_company.add_argument("--user-id", help="User ID for auto-matching")
 
-    # Match commands
-    match_parser = subparsers.add_parser("match", help="Match jobs to user")
+
+def _build_match(match_parser: argparse.ArgumentParser) -> None:
     match_parser.add_argument("--user-id", required=True, help="User ID")
     match_parser.add_argument("--job-id", help="Specific job ID to match")
 
-    # Apply commands
-    apply_parser = subparsers.add_parser("apply", help="Prepare application")
+
+def _build_apply(apply_parser: argparse.ArgumentParser) -> None:
     apply_parser.add_argument("--user-id", required=True, help="User ID")
     apply_parser.add_argument("--job-id", required=True, help="Job ID")
 
-    # Status commands
-    status_parser = subparsers.add_parser("status", help="Check application status")
+
+def _build_status(status_parser: argparse.ArgumentParser) -> None:
     status_subparsers = status_parser.add_subparsers(dest="status_action")
 
     status_list = status_subparsers.add_parser("list", help="List all applications")
@@ -102,34 +84,77 @@ def create_parser() -> argparse.ArgumentParser:
     status_update.add_argument("--status", required=True, help="New status")
     status_update.add_argument("--note", help="Optional note")
 
-    # Digest commands
-    digest_parser = subparsers.add_parser("digest", help="Generate digest/summary")
+
+def _build_digest(digest_parser: argparse.ArgumentParser) -> None:
     digest_parser.add_argument("--user-id", required=True, help="User ID")
     digest_parser.add_argument("--type", choices=["daily", "weekly", "pipeline"],
                                default="daily", help="Digest type")
 
-    # Pipeline commands
-    pipeline_parser = subparsers.add_parser("pipeline", help="Run automated pipeline")
+
+def _build_pipeline(pipeline_parser: argparse.ArgumentParser) -> None:
     pipeline_parser.add_argument("--user-id", required=True, help="User ID")
     pipeline_parser.add_argument("--type", choices=["full_application", "daily_digest", "profile_setup"],
                                  default="full_application", help="Pipeline type")
 
-    # Agent commands
-    agent_parser = subparsers.add_parser("agent", help="Run specific agent")
+
+def _build_agent(agent_parser: argparse.ArgumentParser) -> None:
     agent_parser.add_argument("--name", required=True, help="Agent name")
     agent_parser.add_argument("--task", required=True, help="Task JSON")
 
-    # System commands
-    system_parser = subparsers.add_parser("system", help="System commands")
+
+def _build_system(system_parser: argparse.ArgumentParser) -> None:
     system_subparsers = system_parser.add_subparsers(dest="system_action")
 
-    system_status = system_subparsers.add_parser("status", help="Show system status")
-    system_agents = system_subparsers.add_parser("agents", help="List registered agents")
-    system_reset = system_subparsers.add_parser("reset", help="Reset system state")
+    system_subparsers.add_parser("status", help="Show system status")
+    system_subparsers.add_parser("agents", help="List registered agents")
+    system_subparsers.add_parser("reset", help="Reset system state")
+
+
+# Top-level command -> (help, builder adding its arguments and subcommands)
+COMMANDS: Dict[str, Tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "profile": ("Manage user profile", _build_profile),
+    "preferences": ("Manage job preferences", _build_preferences),
+    "scrape": ("Scrape jobs", _build_scrape),
+    "match": ("Match jobs to user", _build_match),
+    "apply": ("Prepare application", _build_apply),
+    "status": ("Check application status", _build_status),
+    "digest": ("Generate digest/summary", _build_digest),
+    "pipeline": ("Run automated pipeline", _build_pipeline),
+    "agent": ("Run specific agent", _build_agent),
+    "system": ("System commands", _build_system),
+}
+
+
+def create_parser(commands: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
+    """
+    Create the argument parser
+
+    Every top-level command is registered, but only those in commands get
+    their arguments and subcommands built; all of them when commands is None.
+    """
+    parser = argparse.ArgumentParser(
+        prog="jobcopilot",
+        description="JobCopilot - Multi-Agent Job Application Automation System"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    build = set(COMMANDS if commands is None else commands)
+    for name, (help_text, builder) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name in build:
+            builder(command_parser)
 
     return parser
 
 
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """The top-level command named on the command line, if any"""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def run_command(args: argparse.Namespace) -> None:
     """Run the specified command"""
     orchestrator = Orchestrator()
@@ -173,14 +198,14 @@ def handle_profile_command(orchestrator: Orchestrator, args: argparse.Namespace)
             "resume_path": args.resume
         })
         print(f"Profile created: {result.output_data.get('user_id')}")
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
     elif args.profile_action == "show":
         result = orchestrator.execute_agent("PROFILE_AGENT", {
             "action": "get_profile",
             "user_id": args.user_id
         })
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
     elif args.profile_action == "update":
         personal = {}
@@ -198,7 +223,7 @@ def handle_profile_command(orchestrator: Orchestrator, args: argparse.Namespace)
             "user_id": args.user_id,
             "personal": personal
         })
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
 
 def handle_preferences_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
@@ -221,7 +246,7 @@ def handle_preferences_command(orchestrator: Orchestrator, args: argparse.Namesp
             "user_id": args.user_id,
             "preferences": preferences
         })
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
 
 def handle_scrape_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
@@ -234,7 +259,7 @@ def handle_scrape_command(orchestrator: Orchestrator, args: argparse.Namespace)
             "auto_match": bool(args.user_id)
         })
         print(f"Scraped {result.output_data.get('jobs_found', 0)} jobs")
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
     elif args.scrape_action == "company":
         result = orchestrator.execute_agent("SCRAPER_AGENT", {
@@ -243,7 +268,7 @@ def handle_scrape_command(orchestrator: Orchestrator, args: argparse.Namespace)
             "user_id": args.user_id,
             "auto_match": bool(args.user_id)
         })
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
 
 def handle_match_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
@@ -259,7 +284,7 @@ def handle_match_command(orchestrator: Orchestrator, args: argparse.Namespace) -
             "action": "match_jobs",
             "user_id": args.user_id
         })
-    print(json.dumps(result.output_data, indent=2))
+    print(_dumps(result.output_data))
 
 
 def handle_apply_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
@@ -286,7 +311,7 @@ def handle_status_command(orchestrator: Orchestrator, args: argparse.Namespace)
             "user_id": args.user_id,
             "status": args.filter
         })
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
     elif args.status_action == "update":
         result = orchestrator.execute_agent("TRACKER_AGENT", {
@@ -295,7 +320,7 @@ def handle_status_command(orchestrator: Orchestrator, args: argparse.Namespace)
             "status": args.status,
             "note": args.note
         })
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
 
 def handle_digest_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
@@ -314,7 +339,7 @@ def handle_digest_command(orchestrator: Orchestrator, args: argparse.Namespace)
     if args.type == "daily":
         print(result.output_data.get("digest", ""))
     else:
-        print(json.dumps(result.output_data, indent=2))
+        print(_dumps(result.output_data))
 
 
 def handle_pipeline_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
@@ -334,14 +359,14 @@ def handle_agent_command(orchestrator: Orchestrator, args: argparse.Namespace) -
         return
 
     result = orchestrator.execute_agent(args.name, task)
-    print(json.dumps(result.to_dict(), indent=2))
+    print(_dumps(result.to_dict()))
 
 
 def handle_system_command(orchestrator: Orchestrator, args: argparse.Namespace) -> None:
     """Handle system commands"""
     if args.system_action == "status":
         status = orchestrator.get_system_status()
-        print(json.dumps(status, indent=2, default=str))
+        print(_dumps(status))
 
     elif args.system_action == "agents":
         from .core.registry import AgentRegistry
@@ -357,7 +382,10 @@ def handle_system_command(orchestrator: Orchestrator, args: argparse.Namespace)
 
 def main():
     """Main entry point"""
-    parser = create_parser()
+    # Only the invoked command's arguments are built; top-level help lists
+    # every command either way
+    command = _requested_command(sys.argv[1:])
+    parser = create_parser([command] if command else [])
     args = parser.parse_args()
 
     if not args.command:
@@ -13,6 +13,8 @@ from ..utils.database import Database
 class BaseAgent(ABC):
     """Base class for all agents in the JobCopilot system"""
 
+    __slots__ = ("memory", "database", "logger")
+
     def __init__(
         self,
         memory: Optional[SharedMemory] = None,
@@ -20,18 +22,26 @@ class BaseAgent(ABC):
     ):
         self.memory = memory or SharedMemory()
         self.database = database or Database()
-        self.logger = logging.getLogger(self.name)
+        # One logger per agent class, looked up on first instantiation
+        agent_class = type(self)
+        logger = agent_class.__dict__.get("_logger")
+        if logger is None:
+            logger = agent_class._logger = logging.getLogger(self.name)
+        self.logger = logger
+
+    # Agent name identifier and summary, set by each subclass
+    NAME: str = ""
+    DESCRIPTION: str = ""
 
     @property
-    @abstractmethod
     def name(self) -> str:
         """Agent name identifier"""
-        pass
+        return self.NAME
 
     @property
     def description(self) -> str:
         """Agent description"""
-        return ""
+        return self.DESCRIPTION
 
     def get_state(self) -> Dict[str, Any]:
         """Get agent's current state from shared memory"""
@@ -1,6 +1,7 @@
 """Orchestrator for coordinating agent workflows"""
 
 from typing import Any, Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 import logging
 
@@ -13,6 +14,9 @@ from ..utils.database import Database
 class Orchestrator:
     """Coordinates agent execution and workflow management"""
 
+    # Pipeline steps whose dependencies are met run concurrently
+    PIPELINE_WORKERS = 4
+
     def __init__(
         self,
         memory: Optional[SharedMemory] = None,
@@ -86,33 +90,64 @@ class Orchestrator:
         user_id: str,
         pipeline_type: str = "full_application"
     ) -> List[AgentOutput]:
-        """Run a predefined pipeline"""
+        """
+        Run a predefined pipeline
+
+        Each step names the agents it depends on. A step starts as soon as
+        those have finished, so independent steps (tailoring resumes and
+        writing cover letters for the matched jobs) run side by side.
+        Results are returned in pipeline order.
+        """
         pipelines = {
             "full_application": [
-                ("SCRAPER_AGENT", {"action": "scrape_new_jobs"}),
-                ("MATCHER_AGENT", {"action": "match_jobs", "user_id": user_id}),
-                ("RESUME_TAILOR_AGENT", {"action": "tailor_resumes", "user_id": user_id}),
-                ("COVER_LETTER_AGENT", {"action": "generate_letters", "user_id": user_id}),
-                ("TRACKER_AGENT", {"action": "update_tracking", "user_id": user_id}),
+                ("SCRAPER_AGENT", {"action": "scrape_new_jobs"}, set()),
+                ("MATCHER_AGENT", {"action": "match_jobs", "user_id": user_id},
+                 {"SCRAPER_AGENT"}),
+                ("RESUME_TAILOR_AGENT", {"action": "tailor_resumes", "user_id": user_id},
+                 {"MATCHER_AGENT"}),
+                ("COVER_LETTER_AGENT", {"action": "generate_letters", "user_id": user_id},
+                 {"MATCHER_AGENT"}),
+                ("TRACKER_AGENT", {"action": "update_tracking", "user_id": user_id},
+                 {"RESUME_TAILOR_AGENT", "COVER_LETTER_AGENT"}),
             ],
             "daily_digest": [
-                ("TRACKER_AGENT", {"action": "refresh_status", "user_id": user_id}),
-                ("DIGEST_AGENT", {"action": "generate_digest", "user_id": user_id}),
+                ("TRACKER_AGENT", {"action": "refresh_status", "user_id": user_id}, set()),
+                ("DIGEST_AGENT", {"action": "generate_digest", "user_id": user_id},
+                 {"TRACKER_AGENT"}),
             ],
             "profile_setup": [
-                ("PROFILE_AGENT", {"action": "create_profile", "user_id": user_id}),
-                ("RESUME_PARSER_AGENT", {"action": "parse_resume", "user_id": user_id}),
+                ("PROFILE_AGENT", {"action": "create_profile", "user_id": user_id}, set()),
+                ("RESUME_PARSER_AGENT", {"action": "parse_resume", "user_id": user_id},
+                 {"PROFILE_AGENT"}),
             ]
         }
 
         if pipeline_type not in pipelines:
             raise ValueError(f"Unknown pipeline: {pipeline_type}")
 
-        results = []
-        for agent_name, task in pipelines[pipeline_type]:
-            task["user_id"] = user_id
-            result = self.execute_agent(agent_name, task)
-            results.append(result)
+        steps = pipelines[pipeline_type]
+        results: List[Optional[AgentOutput]] = [None] * len(steps)
+        pending = dict(enumerate(steps))
+        done = set()
+
+        with ThreadPoolExecutor(max_workers=self.PIPELINE_WORKERS) as executor:
+            running = {}
+            while pending or running:
+                for index, (agent_name, task, deps) in list(pending.items()):
+                    if deps <= done:
+                        del pending[index]
+                        task["user_id"] = user_id
+                        future = executor.submit(self.execute_agent, agent_name, task)
+                        running[future] = index
+
+                if not running:
+                    raise ValueError(f"Unsatisfiable dependencies in pipeline: {pipeline_type}")
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    results[index] = future.result()
+                    done.add(steps[index][0])
 
         return results
 
@@ -1,7 +1,9 @@
 """Agent registry for managing all available agents"""
 
+import importlib
 from typing import Dict, Optional, Type, List
 from .base_agent import BaseAgent
+from ..agents import AGENT_MODULES as BUILTIN_AGENTS
 from ..utils.memory import SharedMemory
 from ..utils.database import Database
 
@@ -14,6 +16,12 @@ class AgentRegistry:
     _memory: Optional[SharedMemory] = None
     _database: Optional[Database] = None
 
+    # Module defining each built-in agent, imported the first time the agent
+    # is looked up so a command only loads the agents it actually runs
+    AGENT_MODULES: Dict[str, str] = {
+        name: f"..agents{module}" for name, (_, module) in BUILTIN_AGENTS.items()
+    }
+
     @classmethod
     def initialize(
         cls,
@@ -27,43 +35,54 @@ class AgentRegistry:
     @classmethod
     def register(cls, agent_class: Type[BaseAgent]) -> Type[BaseAgent]:
         """Decorator to register an agent class"""
-        # Create a temporary instance to get the name
-        temp_instance = object.__new__(agent_class)
-        if hasattr(agent_class, 'name') and isinstance(agent_class.name, property):
-            # Get the property value by calling the fget
-            name = agent_class.name.fget(temp_instance)
-        else:
-            name = getattr(temp_instance, 'name', agent_class.__name__)
+        name = agent_class.NAME
+        if not name:
+            # Agents written before NAME existed define a name property
+            name = object.__new__(agent_class).name or agent_class.__name__
+            agent_class.NAME = name
         cls._agents[name] = agent_class
         return agent_class
 
+    @classmethod
+    def _load(cls, agent_name: str) -> None:
+        """Import a built-in agent's module so it registers itself"""
+        if agent_name not in cls._agents and agent_name in cls.AGENT_MODULES:
+            importlib.import_module(cls.AGENT_MODULES[agent_name], __package__)
+
     @classmethod
     def get(cls, agent_name: str) -> Optional[BaseAgent]:
         """Get an agent instance by name"""
-        if agent_name not in cls._agents:
+        # Already-built agents are the common case on the execute path
+        instance = cls._instances.get(agent_name)
+        if instance is not None:
+            return instance
+
+        cls._load(agent_name)
+        agent_class = cls._agents.get(agent_name)
+        if agent_class is None:
             return None
 
-        # Return cached instance or create new one
-        if agent_name not in cls._instances:
-            cls._instances[agent_name] = cls._agents[agent_name](
-                memory=cls._memory,
-                database=cls._database
-            )
-        return cls._instances[agent_name]
+        instance = cls._instances[agent_name] = agent_class(
+            memory=cls._memory,
+            database=cls._database
+        )
+        return instance
 
     @classmethod
     def list_agents(cls) -> List[str]:
-        """List all registered agent names"""
-        return list(cls._agents.keys())
+        """List all registered agent names, including built-ins not yet loaded"""
+        return list(dict.fromkeys([*cls.AGENT_MODULES, *cls._agents]))
 
     @classmethod
     def get_agent_info(cls) -> Dict[str, str]:
         """Get info about all registered agents"""
-        info = {}
-        for name, agent_class in cls._agents.items():
-            agent = cls.get(name)
-            info[name] = agent.description if agent else ""
-        return info
+        for name in cls.AGENT_MODULES:
+            cls._load(name)
+        # Descriptions are class attributes, so no agent is instantiated
+        return {
+            name: agent_class.DESCRIPTION
+            for name, agent_class in cls._agents.items()
+        }
 
     @classmethod
     def reset(cls) -> None:
@@ -121,11 +121,19 @@ class JobPreferences:
     job_types: List[str] = field(default_factory=lambda: ["full-time"])
 
 
+# How blacklisted company names are compared against a job's company:
+# "exact" (whole name), "prefix" ("Acme" blocks "Acme Corp") or the
+# legacy "substring" scan. Profiles without a mode use the default.
+BLACKLIST_MODES = ("exact", "prefix", "substring")
+DEFAULT_BLACKLIST_MODE = "prefix"
+
+
 @dataclass
 class Filters:
     required_keywords: List[str] = field(default_factory=list)
     excluded_keywords: List[str] = field(default_factory=list)
     blacklisted_companies: List[str] = field(default_factory=list)
+    blacklist_mode: str = DEFAULT_BLACKLIST_MODE
 
 
 @dataclass
@@ -164,7 +172,8 @@ class UserProfile:
             "filters": {
                 "required_keywords": self.filters.required_keywords,
                 "excluded_keywords": self.filters.excluded_keywords,
-                "blacklisted_companies": self.filters.blacklisted_companies
+                "blacklisted_companies": self.filters.blacklisted_companies,
+                "blacklist_mode": self.filters.blacklist_mode
             },
             "resume": {
                 "raw_text": self.resume.raw_text,
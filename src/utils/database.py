@@ -1,23 +1,87 @@
 """Database operations for JobCopilot"""
 
+import atexit
 import json
+import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import sqlite3
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, indent: bool = False) -> str:
+    """Serialize a row payload, with orjson when it is installed"""
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            # Datetimes and dataclasses go through default=str, as with json
+            return orjson.dumps(data, default=str, option=option).decode()
+        except TypeError:
+            # Out-of-range integers and other values orjson rejects
+            pass
+    return json.dumps(data, indent=2 if indent else None, default=str)
+
+
+def _loads(text: str) -> Any:
+    """Deserialize a row payload, with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            # NaN and other extensions the json module writes
+            pass
+    return json.loads(text)
+
+
+logger = logging.getLogger(__name__)
+
+# Databases holding buffered agent logs, written out at interpreter exit
+_pending_agent_logs: "weakref.WeakSet[Database]" = weakref.WeakSet()
+
+
+def _flush_pending_agent_logs() -> None:
+    for database in list(_pending_agent_logs):
+        database._flush_agent_logs_if_present()
+
+
+atexit.register(_flush_pending_agent_logs)
+
 
 class Database:
     """SQLite database for persistent storage"""
 
     DEFAULT_PATH = "/data/jobcopilot/jobcopilot.db"
 
+    # Agent action logs are buffered and written in one transaction once
+    # LOG_BATCH_SIZE rows have built up, or by a timer LOG_FLUSH_INTERVAL
+    # seconds after the first buffered row, so most actions are logged
+    # without waiting on a commit
+    LOG_BATCH_SIZE = 500
+    LOG_FLUSH_INTERVAL = 2.0
+
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = Path(db_path or self.DEFAULT_PATH)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._local = threading.local()
+        # Bumped on every job write so readers holding cached jobs can tell
+        # they may be stale
+        self.job_writes = 0
+        self._log_buffer: List[Tuple] = []
+        self._log_lock = threading.Lock()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -75,6 +139,18 @@ class Database:
             )
         ''')
 
+        # Application timelines, append-only and kept out of the data JSON
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS application_timeline (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                app_id TEXT NOT NULL,
+                status TEXT,
+                date TEXT,
+                note TEXT,
+                FOREIGN KEY (app_id) REFERENCES applications(app_id)
+            )
+        ''')
+
         # Agent logs table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS agent_logs (
@@ -87,14 +163,67 @@ class Database:
             )
         ''')
 
+        # Background scrape jobs and their results
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_jobs (
+                scrape_id TEXT PRIMARY KEY,
+                url TEXT,
+                status TEXT DEFAULT 'queued',
+                data JSON NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Cached results of derived computations, keyed by content hash
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data JSON NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (namespace, key)
+            )
+        ''')
+
         # Create indexes
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_user ON applications(user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)')
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_applications_user_job ON applications(user_id, job_id, updated_at)'
+        )
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_applications_user_status ON applications(user_id, status)'
+        )
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_timeline_app ON application_timeline(app_id, id)'
+        )
 
         conn.commit()
 
+        if conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+            self._migrate_timelines(conn)
+
+    def _migrate_timelines(self, conn: sqlite3.Connection) -> None:
+        """Move timelines stored inside application JSON into their own table"""
+        with conn:
+            rows = conn.execute('SELECT app_id, data FROM applications').fetchall()
+            for row in rows:
+                data = _loads(row['data'])
+                if 'timeline' not in data:
+                    continue
+                conn.executemany(
+                    self._TIMELINE_INSERT,
+                    [self._timeline_row(row['app_id'], entry) for entry in data.pop('timeline') or []]
+                )
+                conn.execute(
+                    'UPDATE applications SET data = ? WHERE app_id = ?',
+                    (_dumps(data), row['app_id'])
+                )
+            conn.execute('PRAGMA user_version = 1')
+
     # User operations
     def save_user(self, user_id: str, data: Dict[str, Any]) -> None:
         """Save or update a user profile"""
@@ -106,7 +235,7 @@ class Database:
             ON CONFLICT(user_id) DO UPDATE SET
                 data = excluded.data,
                 updated_at = CURRENT_TIMESTAMP
-        ''', (user_id, json.dumps(data, default=str)))
+        ''', (user_id, _dumps(data)))
         conn.commit()
 
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
@@ -115,7 +244,7 @@ class Database:
         cursor = conn.cursor()
         cursor.execute('SELECT data FROM users WHERE user_id = ?', (user_id,))
         row = cursor.fetchone()
-        return json.loads(row['data']) if row else None
+        return _loads(row['data']) if row else None
 
     def list_users(self) -> List[str]:
         """List all user IDs"""
@@ -141,10 +270,11 @@ class Database:
             data.get('title', ''),
             data.get('location', ''),
             data.get('remote_status', ''),
-            json.dumps(data, default=str),
+            _dumps(data),
             data.get('status', 'new')
         ))
         conn.commit()
+        self.job_writes += 1
 
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get a job by ID"""
@@ -152,7 +282,23 @@ class Database:
         cursor = conn.cursor()
         cursor.execute('SELECT data FROM jobs WHERE job_id = ?', (job_id,))
         row = cursor.fetchone()
-        return json.loads(row['data']) if row else None
+        return _loads(row['data']) if row else None
+
+    def get_jobs_by_ids(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the jobs found for any of the IDs, keyed by job ID"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        jobs = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT job_id, data FROM jobs WHERE job_id IN ({placeholders})',
+                chunk
+            )
+            jobs.update((row['job_id'], _loads(row['data'])) for row in cursor.fetchall())
+        return jobs
 
     def search_jobs(
         self,
@@ -182,49 +328,217 @@ class Database:
         params.append(limit)
 
         cursor.execute(query, params)
-        return [json.loads(row['data']) for row in cursor.fetchall()]
+        return [_loads(row['data']) for row in cursor.fetchall()]
+
+    def iter_jobs(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate jobs newest first, fetching rows in batches"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        query = 'SELECT data FROM jobs'
+        params = []
+
+        if status:
+            query += ' WHERE status = ?'
+            params.append(status)
+
+        query += ' ORDER BY scraped_at DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield _loads(row['data'])
 
     def get_jobs_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get all jobs with a specific status"""
         return self.search_jobs(status=status, limit=1000)
 
     # Application operations
-    def save_application(self, app_id: str, data: Dict[str, Any]) -> None:
-        """Save or update an application"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO applications (app_id, job_id, user_id, status, match_score, data, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(app_id) DO UPDATE SET
-                status = excluded.status,
-                match_score = excluded.match_score,
-                data = excluded.data,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (
+    _APPLICATION_UPSERT = '''
+        INSERT INTO applications (app_id, job_id, user_id, status, match_score, data, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(app_id) DO UPDATE SET
+            status = excluded.status,
+            match_score = excluded.match_score,
+            data = excluded.data,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+
+    _TIMELINE_INSERT = '''
+        INSERT INTO application_timeline (app_id, status, date, note)
+        VALUES (?, ?, ?, ?)
+    '''
+
+    @staticmethod
+    def _application_row(app_id: str, data: Dict[str, Any]) -> tuple:
+        # The timeline lives in application_timeline, never in the data JSON
+        if 'timeline' in data:
+            data = {key: value for key, value in data.items() if key != 'timeline'}
+        return (
             app_id,
             data.get('job_id', ''),
             data.get('user_id', ''),
             data.get('status', 'preparing'),
             data.get('match_score', 0),
-            json.dumps(data, default=str)
-        ))
+            _dumps(data)
+        )
+
+    @staticmethod
+    def _timeline_row(app_id: str, entry: Dict[str, Any]) -> tuple:
+        return (app_id, entry.get('status'), entry.get('date'), entry.get('note', ''))
+
+    def save_application(self, app_id: str, data: Dict[str, Any]) -> None:
+        """Save or update an application"""
+        conn = self._get_connection()
+        conn.execute(self._APPLICATION_UPSERT, self._application_row(app_id, data))
+        conn.commit()
+
+    def save_applications_bulk(
+        self,
+        applications: List[Dict[str, Any]],
+        timeline: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+    ) -> None:
+        """Save or update many applications and append timeline entries in a single transaction"""
+        if not applications and not timeline:
+            return
+        conn = self._get_connection()
+        with conn:
+            conn.executemany(
+                self._APPLICATION_UPSERT,
+                [self._application_row(app['app_id'], app) for app in applications]
+            )
+            if timeline:
+                conn.executemany(
+                    self._TIMELINE_INSERT,
+                    [self._timeline_row(app_id, entry) for app_id, entry in timeline]
+                )
+
+    def update_application(
+        self,
+        app_id: str,
+        fields: Dict[str, Any],
+        timeline_entry: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Set scalar top-level fields of an application in place, optionally appending to its timeline"""
+        conn = self._get_connection()
+        paths = ', '.join(f"'$.{key}', ?" for key in fields)
+        with conn:
+            conn.execute(
+                f'''
+                UPDATE applications SET
+                    status = COALESCE(?, status),
+                    data = json_set(data, {paths}),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE app_id = ?
+                ''',
+                (fields.get('status'), *fields.values(), app_id)
+            )
+            if timeline_entry:
+                conn.execute(self._TIMELINE_INSERT, self._timeline_row(app_id, timeline_entry))
+
+    def append_timeline(self, app_id: str, entry: Dict[str, Any]) -> None:
+        """Append an entry to an application's timeline"""
+        conn = self._get_connection()
+        conn.execute(self._TIMELINE_INSERT, self._timeline_row(app_id, entry))
         conn.commit()
 
-    def get_application(self, app_id: str) -> Optional[Dict[str, Any]]:
+    def get_timeline(self, app_id: str) -> List[Dict[str, Any]]:
+        """Get an application's timeline, oldest entry first"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT status, date, note FROM application_timeline WHERE app_id = ? ORDER BY id',
+            (app_id,)
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _attach_timelines(self, applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in the timeline of each application with one query per 500 applications"""
+        timelines: Dict[str, List[Dict[str, Any]]] = {}
+        for app in applications:
+            app['timeline'] = timelines.setdefault(app.get('app_id', ''), [])
+        app_ids = list(timelines)
+        cursor = self._get_connection().cursor()
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(app_ids), 500):
+            chunk = app_ids[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT app_id, status, date, note FROM application_timeline '
+                f'WHERE app_id IN ({placeholders}) ORDER BY id',
+                chunk
+            )
+            for row in cursor.fetchall():
+                timelines[row['app_id']].append(
+                    {'status': row['status'], 'date': row['date'], 'note': row['note']}
+                )
+        return applications
+
+    def get_application_state(self, app_id: str) -> Optional[Dict[str, Any]]:
+        """Get an application's status and submitted_at without decoding its data"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT status, json_extract(data, '$.submitted_at') AS submitted_at "
+            'FROM applications WHERE app_id = ?',
+            (app_id,)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_application(
+        self,
+        app_id: str,
+        with_timeline: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """Get an application by ID"""
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT data FROM applications WHERE app_id = ?', (app_id,))
         row = cursor.fetchone()
-        return json.loads(row['data']) if row else None
+        if not row:
+            return None
+        application = _loads(row['data'])
+        if with_timeline:
+            application['timeline'] = self.get_timeline(app_id)
+        return application
+
+    def get_application_by_user_job(
+        self,
+        user_id: str,
+        job_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get the most recently updated application for a user and job"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT data FROM applications WHERE user_id = ? AND job_id = ? ORDER BY updated_at DESC LIMIT 1',
+            (user_id, job_id)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return self._attach_timelines([_loads(row['data'])])[0]
 
     def get_user_applications(
         self,
         user_id: str,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        status_in: Optional[List[str]] = None,
+        with_timeline: bool = True
     ) -> List[Dict[str, Any]]:
-        """Get all applications for a user"""
+        """Get all applications for a user, optionally limited to some statuses"""
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -233,12 +547,32 @@ class Database:
                 'SELECT data FROM applications WHERE user_id = ? AND status = ? ORDER BY updated_at DESC',
                 (user_id, status)
             )
+        elif status_in is not None:
+            placeholders = ', '.join('?' * len(status_in))
+            cursor.execute(
+                f'SELECT data FROM applications WHERE user_id = ? AND status IN ({placeholders}) '
+                'ORDER BY updated_at DESC',
+                (user_id, *status_in)
+            )
         else:
             cursor.execute(
                 'SELECT data FROM applications WHERE user_id = ? ORDER BY updated_at DESC',
                 (user_id,)
             )
-        return [json.loads(row['data']) for row in cursor.fetchall()]
+        applications = [_loads(row['data']) for row in cursor.fetchall()]
+        return self._attach_timelines(applications) if with_timeline else applications
+
+    def get_user_applications_version(self, user_id: str) -> Tuple[Any, ...]:
+        """Get a cheap fingerprint of a user's applications that changes on any write"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        # updated_at only has second resolution; the newest rowid also moves
+        # when an application is replaced by a new one within that second
+        cursor.execute(
+            'SELECT COUNT(*), MAX(updated_at), MAX(rowid) FROM applications WHERE user_id = ?',
+            (user_id,)
+        )
+        return tuple(cursor.fetchone())
 
     def get_application_stats(self, user_id: str) -> Dict[str, int]:
         """Get application statistics for a user"""
@@ -260,19 +594,51 @@ class Database:
         input_data: Optional[Dict] = None,
         output_data: Optional[Dict] = None
     ) -> None:
-        """Log an agent action"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO agent_logs (agent, action, input_data, output_data)
-            VALUES (?, ?, ?, ?)
-        ''', (
+        """Log an agent action; rows are buffered and written in batches"""
+        # Serialize now so later changes to the payloads are not logged
+        row = (
             agent,
             action,
-            json.dumps(input_data, default=str) if input_data else None,
-            json.dumps(output_data, default=str) if output_data else None
-        ))
-        conn.commit()
+            _dumps(input_data) if input_data else None,
+            _dumps(output_data) if output_data else None,
+            datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        )
+        with self._log_lock:
+            if not self._log_buffer:
+                _pending_agent_logs.add(self)
+                timer = threading.Timer(
+                    self.LOG_FLUSH_INTERVAL, self._flush_agent_logs_if_present
+                )
+                timer.daemon = True
+                timer.start()
+            self._log_buffer.append(row)
+            due = len(self._log_buffer) >= self.LOG_BATCH_SIZE
+        if due:
+            self.flush_agent_logs()
+
+    def flush_agent_logs(self) -> None:
+        """Write all buffered agent logs in one transaction"""
+        # The lock is held through the write so batches land in order
+        with self._log_lock:
+            rows, self._log_buffer = self._log_buffer, []
+            _pending_agent_logs.discard(self)
+            if not rows:
+                return
+            conn = self._get_connection()
+            try:
+                with conn:
+                    conn.executemany('''
+                        INSERT INTO agent_logs
+                            (agent, action, input_data, output_data, timestamp)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', rows)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write {len(rows)} agent logs: {e}")
+
+    def _flush_agent_logs_if_present(self) -> None:
+        # Nothing to write to once the database file has been removed
+        if self.db_path.exists():
+            self.flush_agent_logs()
 
     def get_agent_logs(
         self,
@@ -280,6 +646,7 @@ class Database:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get agent logs"""
+        self.flush_agent_logs()
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -296,7 +663,98 @@ class Database:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    # Scrape job operations
+    def save_scrape_job(self, scrape_id: str, data: Dict[str, Any]) -> None:
+        """Save or update a background scrape job"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO scrape_jobs (scrape_id, url, status, data, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(scrape_id) DO UPDATE SET
+                status = excluded.status,
+                data = excluded.data,
+                updated_at = CURRENT_TIMESTAMP
+        ''', (
+            scrape_id,
+            data.get('url', ''),
+            data.get('status', 'queued'),
+            _dumps(data)
+        ))
+        conn.commit()
+
+    def get_scrape_job(self, scrape_id: str) -> Optional[Dict[str, Any]]:
+        """Get a background scrape job"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT data FROM scrape_jobs WHERE scrape_id = ?', (scrape_id,))
+        row = cursor.fetchone()
+        return _loads(row['data']) if row else None
+
+    # Cache operations
+    def get_cached(self, namespace: str, key: str) -> Optional[Any]:
+        """Get a cached result"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT data FROM cache WHERE namespace = ? AND key = ?',
+            (namespace, key)
+        )
+        row = cursor.fetchone()
+        return _loads(row['data']) if row else None
+
+    def save_cached(self, namespace: str, key: str, data: Any) -> None:
+        """Save or replace a cached result"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO cache (namespace, key, data)
+            VALUES (?, ?, ?)
+        ''', (namespace, key, _dumps(data)))
+        conn.commit()
+
+    def get_cached_many(self, namespace: str, keys: List[str]) -> Dict[str, Any]:
+        """Get the cached results found for any of the keys"""
+        if not keys:
+            return {}
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        placeholders = ', '.join('?' * len(keys))
+        cursor.execute(
+            f'SELECT key, data FROM cache WHERE namespace = ? AND key IN ({placeholders})',
+            (namespace, *keys)
+        )
+        return {row['key']: _loads(row['data']) for row in cursor.fetchall()}
+
+    def save_cached_many(self, namespace: str, entries: Dict[str, Any]) -> None:
+        """Save or replace many cached results in a single transaction"""
+        if not entries:
+            return
+        conn = self._get_connection()
+        with conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO cache (namespace, key, data)
+                VALUES (?, ?, ?)
+            ''', [
+                (namespace, key, _dumps(data))
+                for key, data in entries.items()
+            ])
+
+    def purge_cache(self, namespace: str, max_age: Optional[float] = None) -> int:
+        """Delete a namespace's cached results, or only those older than max_age seconds"""
+        conn = self._get_connection()
+        with conn:
+            if max_age is None:
+                cursor = conn.execute('DELETE FROM cache WHERE namespace = ?', (namespace,))
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND created_at < datetime('now', ?)",
+                    (namespace, f"-{int(max_age)} seconds")
+                )
+        return cursor.rowcount
+
     def close(self) -> None:
         """Close database connection"""
+        self.flush_agent_logs()
         if hasattr(self._local, 'connection'):
             self._local.connection.close()
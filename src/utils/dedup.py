@@ -0,0 +1,72 @@
+"""Near-duplicate detection for job listings using MinHash with LSH banding"""
+
+import hashlib
+import random
+import re
+import struct
+from typing import List, Tuple
+
+# Signature size and banding; with 8 bands of 16 rows two listings share a
+# band with probability 1 - (1 - J**16)**8, which crosses 0.5 near a Jaccard
+# similarity of 0.88
+NUM_PERM = 128
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+
+# Word shingles per listing
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = tuple(
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+)
+_WORD_RE = re.compile(r'\w+')
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse text to its words"""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def content_hash(text: str) -> str:
+    """Exact-duplicate fingerprint of normalized text"""
+    return hashlib.blake2b(normalize_text(text).encode(), digest_size=16).hexdigest()
+
+
+def _shingle_hashes(text: str) -> List[int]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= SHINGLE_SIZE:
+        shingles = {" ".join(words)} if words else set()
+    else:
+        shingles = {
+            " ".join(words[i:i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+    return [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+        for s in shingles
+    ]
+
+
+def minhash_signature(text: str) -> Tuple[int, ...]:
+    """MinHash signature of the text's word shingles, empty for blank text"""
+    hashes = _shingle_hashes(text)
+    if not hashes:
+        return ()
+    prime = _MERSENNE_PRIME
+    return tuple(
+        min((a * h + b) % prime for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def lsh_band_keys(signature: Tuple[int, ...]) -> List[str]:
+    """One bucket key per band; similar signatures share at least one"""
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(struct.pack(f"<{len(rows)}Q", *rows), digest_size=8)
+        keys.append(f"{band}:{digest.hexdigest()}")
+    return keys
@@ -0,0 +1,39 @@
+"""Time-sortable unique identifiers"""
+
+import os
+import threading
+import time
+
+# Crockford base32, as used by ULID
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def new_ulid() -> str:
+    """
+    Generate a 26-character ULID: a 48-bit millisecond timestamp followed by
+    80 random bits, Crockford base32 encoded
+
+    IDs sort lexicographically by creation time, so inserts land at the tail
+    of a primary key index. Within one millisecond the random part is
+    incremented rather than redrawn, keeping IDs from a process monotonic.
+    """
+    global _last_ms, _last_random
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms <= _last_ms:
+            now_ms = _last_ms
+            _last_random = (_last_random + 1) & ((1 << 80) - 1)
+        else:
+            _last_ms = now_ms
+            _last_random = int.from_bytes(os.urandom(10), "big")
+        value = (now_ms << 80) | _last_random
+
+    chars = []
+    for _ in range(26):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
@@ -0,0 +1,37 @@
+"""Shared keyword matchers for job and resume text"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+
+def _trie_pattern(terms: Tuple[str, ...]) -> str:
+    """Build a regex matching any of the terms, factored by shared prefixes"""
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term.lower():
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A term ending here makes the rest of the branch optional
+        return "(?:" + pattern + ")?" if "" in node else pattern
+
+    return emit(trie)
+
+
+@lru_cache(maxsize=None)
+def keyword_matcher(terms: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile a case-insensitive whole-word matcher for a fixed set of terms
+
+    The alternation is prefix-factored, so the engine follows a single branch
+    per character instead of retrying every term at each position. Matchers
+    are built once per distinct term tuple and shared process-wide.
+    """
+    return re.compile(r"\b(?:" + _trie_pattern(terms) + r")\b", re.IGNORECASE)
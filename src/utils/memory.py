@@ -1,5 +1,6 @@
 """Shared memory management for inter-agent communication"""
 
+import copy
 import json
 import os
 from datetime import datetime
@@ -9,7 +10,12 @@ import threading
 
 
 class SharedMemory:
-    """Thread-safe shared memory for agent communication"""
+    """
+    Thread-safe shared memory for agent communication
+
+    Values are copied on the way in and out, so agents running in parallel
+    pipeline steps never hold a reference into the shared cache.
+    """
 
     DEFAULT_PATH = "/data/jobcopilot/memory.json"
 
@@ -66,7 +72,7 @@ class SharedMemory:
                     value = value[k]
                 else:
                     return default
-            return value
+            return copy.deepcopy(value)
 
     def set(self, key: str, value: Any) -> None:
         """Set a value in memory"""
@@ -77,7 +83,7 @@ class SharedMemory:
                 if k not in target:
                     target[k] = {}
                 target = target[k]
-            target[keys[-1]] = value
+            target[keys[-1]] = copy.deepcopy(value)
             self._save()
 
     def update(self, updates: Dict[str, Any]) -> None:
@@ -151,7 +157,7 @@ class SharedMemory:
     def get_all(self) -> Dict[str, Any]:
         """Get entire memory state"""
         with self._lock:
-            return self._cache.copy()
+            return copy.deepcopy(self._cache)
 
     def clear(self) -> None:
         """Clear all memory"""
@@ -3,6 +3,8 @@
 import sys
 import os
 import tempfile
+import threading
+import time
 import pytest
 
 # Add src to path for imports
@@ -10,7 +12,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.utils.memory import SharedMemory
 from src.utils.database import Database
-from src.schemas import UserProfile, Job, Application, AgentOutput
+from src.schemas import UserProfile, Job, Application, AgentOutput, Filters
+from src.agents.resume_parser_agent import ResumeParserAgent
+from src.agents.qa_agent import QAAgent
+from src.agents.scraper_agent import ScraperAgent
+from src.agents.matcher_agent import MatcherAgent
+from src.agents.resume_tailor_agent import ResumeTailorAgent
+from src.core.base_agent import BaseAgent
+from src.core.registry import AgentRegistry
+from src.core.orchestrator import Orchestrator
 
 
 class TestSharedMemory:
@@ -50,6 +60,38 @@ class TestSharedMemory:
             item = memory.pop_from_queue()
             assert item["task"] == "test2"
 
+    def test_memory_values_are_copied(self):
+        """Test callers never hold a reference into the shared cache"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            memory = SharedMemory(f.name)
+            sources = [{"url": "https://a.example"}]
+            memory.set("scraper_sources", sources)
+            sources.append({"url": "https://b.example"})
+            memory.get("scraper_sources").append({"url": "https://c.example"})
+            memory.get_all()["scraper_sources"].clear()
+            assert memory.get("scraper_sources") == [{"url": "https://a.example"}]
+
+    def test_memory_concurrent_writes(self):
+        """Test parallel writers do not lose updates or corrupt the file"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            memory = SharedMemory(f.name)
+
+            def write(worker):
+                for i in range(50):
+                    memory.set(f"agent_state.W{worker}", {"step": i})
+                    memory.log(f"W{worker}", "step", {"i": i})
+
+            threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            reloaded = SharedMemory(f.name)
+            for w in range(4):
+                assert reloaded.get(f"agent_state.W{w}") == {"step": 49}
+            assert len(reloaded.get_logs(limit=1000)) == 200
+
 
 class TestDatabase:
     """Tests for Database"""
@@ -95,6 +137,69 @@ class TestDatabase:
             job = db.get_job("job1")
             assert job["company"] == "Test Corp"
 
+    def test_iter_jobs(self):
+        """Test streaming jobs in batches"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db = Database(f.name)
+
+            for i in range(5):
+                db.save_job(f"job{i}", {
+                    "company": "Test Corp",
+                    "title": f"Engineer {i}",
+                    "status": "matched" if i % 2 else "new"
+                })
+
+            assert len(list(db.iter_jobs(batch_size=2))) == 5
+            assert len(list(db.iter_jobs(limit=3, batch_size=2))) == 3
+            assert len(list(db.iter_jobs(status="matched"))) == 2
+
+    def test_cache(self):
+        """Test cached results are stored per namespace"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db = Database(f.name)
+
+            assert db.get_cached("tailor", "key1") is None
+            db.save_cached("tailor", "key1", {"keywords": ["python"]})
+            assert db.get_cached("tailor", "key1") == {"keywords": ["python"]}
+            assert db.get_cached("other", "key1") is None
+
+    def test_application_timeline(self):
+        """Test timeline entries are appended outside the application record"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db = Database(f.name)
+
+            db.save_applications_bulk(
+                [{"app_id": "app1", "user_id": "user1", "job_id": "job1", "status": "preparing"}],
+                timeline=[("app1", {"status": "preparing", "date": "2024-01-01", "note": "created"})]
+            )
+            db.update_application(
+                "app1",
+                {"status": "submitted", "submitted_at": "2024-01-02"},
+                timeline_entry={"status": "submitted", "date": "2024-01-02", "note": "sent"}
+            )
+
+            app = db.get_application("app1")
+            assert app["status"] == "submitted"
+            assert app["submitted_at"] == "2024-01-02"
+            assert [t["note"] for t in app["timeline"]] == ["created", "sent"]
+            assert db.get_user_applications("user1")[0]["timeline"] == app["timeline"]
+
+            app = db.get_application("app1", with_timeline=False)
+            assert app["status"] == "submitted"
+            assert "timeline" not in app
+
+    def test_agent_logs_flushed_when_idle(self):
+        """Test a buffered agent log is written without further activity"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db = Database(f.name)
+            db.LOG_FLUSH_INTERVAL = 0.05
+
+            db.log_agent_action("TEST_AGENT", "test_action", output_data={"ok": True})
+            time.sleep(0.5)
+
+            count = db._get_connection().execute('SELECT COUNT(*) FROM agent_logs').fetchone()[0]
+            assert count == 1
+
 
 class TestSchemas:
     """Tests for data schemas"""
@@ -138,5 +243,372 @@ class TestSchemas:
         assert output_dict["next_agent"] == "NEXT_AGENT"
 
 
+class TestResumeParser:
+    """Tests for ResumeParserAgent"""
+
+    def test_keywords_match_whole_words(self):
+        """Test keywords are not matched inside longer words"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = ResumeParserAgent(
+                SharedMemory(os.path.join(d, "memory.json")),
+                Database(os.path.join(d, "jobcopilot.db"))
+            )
+            result = agent.execute({
+                "action": "extract_keywords",
+                "text": "Built React apps in JavaScript, C++ and Node.js"
+            })
+            keywords = result.output_data["keywords"]
+            assert set(keywords) == {"react", "javascript", "c++", "node.js"}
+
+    def test_cached_parse_is_not_shared(self):
+        """Test changing a parse result does not affect later parses of the same text"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = ResumeParserAgent(
+                SharedMemory(os.path.join(d, "memory.json")),
+                Database(os.path.join(d, "jobcopilot.db"))
+            )
+            task = {"action": "parse_resume", "resume_text": "Skills\nPython, Docker, SQL"}
+            first = agent.execute(task).output_data["parsed_resume"]
+            first["skills"]["technical"].append("cobol")
+
+            second = agent.execute(task).output_data["parsed_resume"]
+            assert "cobol" not in second["skills"]["technical"]
+            assert "python" in second["skills"]["technical"]
+
+
+class TestQAAgent:
+    """Tests for QAAgent"""
+
+    def test_batch_classification_with_separator(self):
+        """Test questions containing the batch separator are still classified"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = QAAgent(
+                SharedMemory(os.path.join(d, "memory.json")),
+                Database(os.path.join(d, "jobcopilot.db"))
+            )
+            questions = [
+                "Intro\x1eDo you have the legal right to work here?",
+                "Are you willing to relocate?",
+            ]
+            types = agent._classify_question_types(questions)
+            assert types == [agent._classify_question_type(q) for q in questions]
+            assert [t.label for t in types] == ["work_authorization", "relocation"]
+
+
+class TestScraperAgent:
+    """Tests for ScraperAgent"""
+
+    DESCRIPTION = " ".join(
+        f"we build reliable data pipelines and service number {i} for our customers"
+        for i in range(12)
+    )
+
+    def _scrape(self, agent, jobs):
+        agent._fetch_jobs = lambda url, board_type: iter([dict(job) for job in jobs])
+        return agent.execute({"action": "scrape_url", "url": "https://example.com/jobs"}).output_data
+
+    def test_duplicate_listings_are_skipped(self):
+        """Test exact and near-duplicate reposts are not saved again"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = ScraperAgent(
+                SharedMemory(os.path.join(d, "memory.json")),
+                Database(os.path.join(d, "jobcopilot.db"))
+            )
+            original = {"company": "Acme", "title": "Data Engineer",
+                        "location": "Remote", "description": self.DESCRIPTION}
+            first = self._scrape(agent, [original])
+            assert first["jobs_saved"] == 1
+            original_id = first["job_ids"][0]
+
+            exact = dict(original, location="New York")
+            near = dict(original, location="Boston",
+                        description=self.DESCRIPTION.replace("number 5", "number five"))
+            other_company = dict(original, company="Globex")
+            second = self._scrape(agent, [exact, near, other_company])
+
+            assert second["jobs_found"] == 3
+            assert second["jobs_saved"] == 1
+            assert sorted(second["duplicates"].values()) == [original_id, original_id]
+
+    def test_stale_dedup_keys_are_ignored(self):
+        """Test keys pointing at a job that no longer exists do not block it"""
+        with tempfile.TemporaryDirectory() as d:
+            db = Database(os.path.join(d, "jobcopilot.db"))
+            agent = ScraperAgent(SharedMemory(os.path.join(d, "memory.json")), db)
+            job = {"company": "Acme", "title": "Data Engineer",
+                   "location": "Remote", "description": self.DESCRIPTION}
+            self._scrape(agent, [job])
+            conn = db._get_connection()
+            with conn:
+                conn.execute('DELETE FROM jobs')
+
+            result = self._scrape(agent, [dict(job, location="Boston")])
+            assert result["jobs_saved"] == 1
+            assert result["duplicates"] == {}
+
+
+class TestMatcherAgent:
+    """Tests for MatcherAgent"""
+
+    def _agent(self, d):
+        return MatcherAgent(
+            SharedMemory(os.path.join(d, "memory.json")),
+            Database(os.path.join(d, "jobcopilot.db"))
+        )
+
+    def _blocked(self, agent, blacklist, company, mode=None):
+        filters = {"blacklisted_companies": blacklist}
+        if mode is not None:
+            filters["blacklist_mode"] = mode
+        ctx = agent._build_user_ctx({"filters": filters})
+        filtered_out, _ = agent._check_filters(ctx, {"company": company})
+        return filtered_out
+
+    def test_blacklist_defaults_to_prefix(self):
+        """Test the default mode blocks names starting with a blacklisted company"""
+        assert Filters().blacklist_mode == "prefix"
+        with tempfile.TemporaryDirectory() as d:
+            agent = self._agent(d)
+            assert self._blocked(agent, ["Acme"], "Acme Corp")
+            assert self._blocked(agent, ["Acme"], "acme")
+            assert not self._blocked(agent, ["Acme"], "The Acme Co")
+
+    def test_blacklist_modes(self):
+        """Test exact, prefix and substring blacklist matching"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = self._agent(d)
+            cases = {
+                "exact": (["ACME"], ["Acme Corp", "The Acme Co"]),
+                "prefix": (["ACME", "Acme Corp"], ["The Acme Co"]),
+                "substring": (["ACME", "Acme Corp", "The Acme Co"], ["Globex"]),
+            }
+            for mode, (blocked, allowed) in cases.items():
+                for company in blocked:
+                    assert self._blocked(agent, ["acme"], company, mode), (mode, company)
+                for company in allowed:
+                    assert not self._blocked(agent, ["acme"], company, mode), (mode, company)
+
+    def test_unknown_blacklist_mode_uses_default(self):
+        """Test an unknown mode falls back to prefix matching"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = self._agent(d)
+            assert self._blocked(agent, ["Acme"], "Acme Corp", "fuzzy")
+            assert not self._blocked(agent, ["Acme"], "The Acme Co", "fuzzy")
+
+    def test_applied_job_ids_refresh_on_replaced_application(self):
+        """Test the applied ids cache notices a delete and re-add with the same count"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = self._agent(d)
+            db = agent.database
+            for job_id in ("job1", "job2"):
+                db.save_application(f"app_{job_id}", {"user_id": "user1", "job_id": job_id})
+            assert agent._get_applied_job_ids("user1") == {"job1", "job2"}
+
+            conn = db._get_connection()
+            conn.execute("DELETE FROM applications WHERE app_id = 'app_job1'")
+            conn.commit()
+            db.save_application("app_job3", {"user_id": "user1", "job_id": "job3"})
+            assert agent._get_applied_job_ids("user1") == {"job2", "job3"}
+
+    def test_applied_job_ids_cache_is_bounded(self):
+        """Test the least recently used users are evicted from the applied ids cache"""
+        with tempfile.TemporaryDirectory() as d:
+            agent = self._agent(d)
+            agent.APPLIED_CACHE_SIZE = 2
+            for user_id in ("user1", "user2", "user1", "user3"):
+                agent._get_applied_job_ids(user_id)
+            assert list(agent._applied_cache) == ["user1", "user3"]
+
+    def test_recommendations_match_full_sort(self):
+        """Test the streaming top-k keeps the order and limit of a full stable sort"""
+        titles = ["Data Engineer", "Senior Data Engineer", "Data Analyst", "Engineer", "Chef"]
+        companies = ["Acme", "Globex", "Initech"]
+        user = {
+            "user_id": "user1",
+            "job_preferences": {"target_titles": ["data engineer"]},
+            "filters": {"blacklisted_companies": ["Initech"]},
+        }
+        with tempfile.TemporaryDirectory() as d:
+            agent = self._agent(d)
+            db = agent.database
+            db.save_user("user1", user)
+            conn = db._get_connection()
+            for i in range(30):
+                job_id = f"job{i:02d}"
+                db.save_job(job_id, {
+                    "job_id": job_id,
+                    "title": titles[i % len(titles)],
+                    "company": companies[i % len(companies)],
+                })
+                # Distinct timestamps so newest-first is well defined for ties
+                conn.execute(
+                    "UPDATE jobs SET scraped_at = datetime('2024-01-01', ?) WHERE job_id = ?",
+                    (f"+{i} minutes", job_id)
+                )
+            conn.commit()
+            for job_id in ("job29", "job10"):
+                db.save_application(f"app_{job_id}", {"user_id": "user1", "job_id": job_id})
+
+            # The previous implementation: score everything, stable sort, slice
+            ctx = agent._build_user_ctx(user)
+            candidates = []
+            for job in db.search_jobs(limit=500):
+                if job["job_id"] in ("job29", "job10"):
+                    continue
+                score, _ = agent._calculate_match_score(user, job)
+                filtered_out, _ = agent._check_filters(ctx, job)
+                if score >= 0 and not filtered_out:
+                    candidates.append((job["job_id"], score))
+            candidates.sort(key=lambda c: c[1], reverse=True)
+            assert len({score for _, score in candidates}) < len(candidates)
+
+            for limit in (1, 3, 7, 100):
+                output = agent.execute({
+                    "action": "get_recommendations",
+                    "user_id": "user1",
+                    "min_score": 0,
+                    "limit": limit,
+                }).output_data
+                got = [(r["job_id"], r["match_score"]) for r in output["recommendations"]]
+                assert got == candidates[:limit], limit
+                assert output["count"] == min(limit, len(candidates))
+
+
+class TestResumeTailorAgent:
+    """Tests for ResumeTailorAgent"""
+
+    def test_cache_purges_retired_and_expired_entries(self):
+        """Test retired namespaces and entries past the TTL are deleted"""
+        with tempfile.TemporaryDirectory() as d:
+            db = Database(os.path.join(d, "jobcopilot.db"))
+            db.save_cached("resume_tailor:v1", "old", {"tailored_resume": "v1"})
+            agent = ResumeTailorAgent(SharedMemory(os.path.join(d, "memory.json")), db)
+            assert db.get_cached("resume_tailor:v1", "old") is None
+
+            namespace = agent.CACHE_NAMESPACE
+            db.save_cached(namespace, "stale", {"tailored_resume": "stale"})
+            db.save_cached(namespace, "fresh", {"tailored_resume": "fresh"})
+            conn = db._get_connection()
+            conn.execute(
+                "UPDATE cache SET created_at = datetime('now', ?) WHERE namespace = ? AND key = ?",
+                (f"-{agent.CACHE_TTL + 60} seconds", namespace, "stale")
+            )
+            conn.commit()
+
+            agent.execute({"action": "tailor_resume", "user_id": "user1", "job_id": "job1"})
+            assert db.get_cached(namespace, "stale") is None
+            assert db.get_cached(namespace, "fresh") == {"tailored_resume": "fresh"}
+
+
+class TestAgentRegistry:
+    """Tests for AgentRegistry"""
+
+    def test_register_name_property_agent(self):
+        """Test agents defining only a name property register under that name"""
+        class LegacyAgent(BaseAgent):
+            @property
+            def name(self) -> str:
+                return "LEGACY_AGENT"
+
+            def execute(self, task):
+                return self.create_output(action="done", output_data={})
+
+        try:
+            AgentRegistry.register(LegacyAgent)
+            assert AgentRegistry._agents["LEGACY_AGENT"] is LegacyAgent
+            assert "LegacyAgent" not in AgentRegistry._agents
+            assert LegacyAgent.NAME == "LEGACY_AGENT"
+        finally:
+            AgentRegistry._agents.pop("LEGACY_AGENT", None)
+
+    def test_builtin_agent_table(self):
+        """Test each built-in agent's class registers under its table name"""
+        import src.agents as agents
+        for name, (class_name, _) in agents.AGENT_MODULES.items():
+            agent_class = getattr(agents, class_name)
+            assert agent_class.NAME == name
+            assert AgentRegistry._agents[name] is agent_class
+
+
+class TestOrchestrator:
+    """Tests for the pipeline DAG runner"""
+
+    def _orchestrator(self, d, execute):
+        orchestrator = Orchestrator(
+            SharedMemory(os.path.join(d, "memory.json")),
+            Database(os.path.join(d, "jobcopilot.db"))
+        )
+        orchestrator.execute_agent = execute
+        return orchestrator
+
+    def test_pipeline_respects_dependencies(self):
+        """Test steps start only after their dependencies finish"""
+        events = []
+        lock = threading.Lock()
+
+        def execute(agent_name, task):
+            with lock:
+                events.append(("start", agent_name))
+            time.sleep(0.05)
+            with lock:
+                events.append(("end", agent_name))
+            return agent_name
+
+        with tempfile.TemporaryDirectory() as d:
+            orchestrator = self._orchestrator(d, execute)
+            results = orchestrator.run_pipeline("user_1")
+
+        assert results == [
+            "SCRAPER_AGENT", "MATCHER_AGENT", "RESUME_TAILOR_AGENT",
+            "COVER_LETTER_AGENT", "TRACKER_AGENT"
+        ]
+        position = {event: i for i, event in enumerate(events)}
+        assert position[("end", "SCRAPER_AGENT")] < position[("start", "MATCHER_AGENT")]
+        for agent_name in ("RESUME_TAILOR_AGENT", "COVER_LETTER_AGENT"):
+            assert position[("end", "MATCHER_AGENT")] < position[("start", agent_name)]
+            assert position[("end", agent_name)] < position[("start", "TRACKER_AGENT")]
+        # Tailoring and cover letters are independent, so they overlap
+        assert position[("start", "COVER_LETTER_AGENT")] < position[("end", "RESUME_TAILOR_AGENT")]
+        assert position[("start", "RESUME_TAILOR_AGENT")] < position[("end", "COVER_LETTER_AGENT")]
+
+    def test_pipeline_passes_user_id(self):
+        """Test every step receives the pipeline user"""
+        tasks = []
+
+        def execute(agent_name, task):
+            tasks.append(task)
+            return agent_name
+
+        with tempfile.TemporaryDirectory() as d:
+            orchestrator = self._orchestrator(d, execute)
+            orchestrator.run_pipeline("user_1", "daily_digest")
+
+        assert [task["user_id"] for task in tasks] == ["user_1", "user_1"]
+
+    def test_pipeline_error_stops_dependents(self):
+        """Test a failing step raises and its dependents never run"""
+        started = []
+
+        def execute(agent_name, task):
+            started.append(agent_name)
+            if agent_name == "MATCHER_AGENT":
+                raise RuntimeError("matcher failed")
+            return agent_name
+
+        with tempfile.TemporaryDirectory() as d:
+            orchestrator = self._orchestrator(d, execute)
+            with pytest.raises(RuntimeError, match="matcher failed"):
+                orchestrator.run_pipeline("user_1")
+
+        assert started == ["SCRAPER_AGENT", "MATCHER_AGENT"]
+
+    def test_unknown_pipeline(self):
+        """Test an unknown pipeline type is rejected"""
+        with tempfile.TemporaryDirectory() as d:
+            orchestrator = self._orchestrator(d, lambda agent_name, task: agent_name)
+            with pytest.raises(ValueError):
+                orchestrator.run_pipeline("user_1", "nope")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])